@@ -1,38 +1,31 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from algorithms.primes import primes_up_to
+from algorithms.sums import power_sum, poly_sum
+
+# The sums below use Faulhaber's closed forms (algorithms.sums), so they take
+# the same time for any range and stay exact for huge ones.
+
 def sum(ll, n):
-    sum = 0
-    for i in range (ll,n + 1):
-        sum = sum + i
-    return sum
+    return power_sum(1, ll, n)
 
 def sum_squared(ll, n):
-    sum_squared = 0
-    for i in range (ll,n + 1):
-        sum_squared += (i*i)
-    return sum_squared
+    return power_sum(2, ll, n)
 
 def sum_const(ll, n, const):
-    const_sum = 0
-    for i in range (ll, n +1):
-        const_sum += const
-    return const_sum
+    return const * power_sum(0, ll, n)
 
 def S(N):
-    A = []
-    for n in range (2,N+1):
-        do_add_n = True
-        for a in A:
-            if n % a == 0:
-                do_add_n = False
-                break
-        if do_add_n:
-            A.append(n)
-    return A
+    # the primes up to N, from a sieve of Eratosthenes (algorithms.primes)
+    # rather than trial division by every smaller prime
+    return primes_up_to(N)
 
 
 def main():
     print ("sum from 1 to 100 = %s \n\n" % sum(0,100))
     print ("sum squared from 1 to 100 = %s \n\n" % sum_squared(0,100))
-    print ("sum of k squared plus k plus 1 from 12 to 123 = %s \n\n" % (sum_squared(12,123) + sum(12,123) + sum_const(12,123,1)))
+    print ("sum of k squared plus k plus 1 from 12 to 123 = %s \n\n" % poly_sum([1, 1, 1], 12, 123))
     print ('S(10) =')
     print (S(10))
     print ('\n\nS(100) =')
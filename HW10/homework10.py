@@ -2,6 +2,10 @@
 from __future__ import division
 from random import randrange
 import math
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from algorithms.msp import kadane, parallel_msp
 #---------------------------------------------------------------------------}}}1
 
 def MSP_bad(A): # {{{
@@ -11,6 +15,20 @@ def MSP_bad(A): # {{{
 
   return max_sum_triple
 #----------------------------------------------------------------------------}}}
+def MSP_linear(A): # {{{
+  # The same (i, j, sum) triple as MSP_bad, with A[i:j] a maximum subarray, by
+  # Kadane's algorithm in O(n); see algorithms.msp for the streaming and
+  # window versions.
+  return kadane(A)
+#----------------------------------------------------------------------------}}}
+def MSP_parallel(A, processes=None): # {{{
+  # The divide and conquer of MSP with the halves returning (total, best
+  # prefix, best suffix, best) summaries instead of just the best sum, so they
+  # combine without rescanning. The chunks are summarized in a process pool
+  # over shared memory; see algorithms.msp, which also has the segment tree
+  # MSPTree for range queries. The subarray is nonempty.
+  return parallel_msp(A, processes)
+#----------------------------------------------------------------------------}}}
 def rand_MSP(n, max_delta): # {{{
   max_delta_0 = max_delta // 2
 
@@ -32,7 +50,7 @@ def MSP(A, low, high):  # {{{
 def maxSum(arr, l, m, h) : 
       
     # Include elements on left of mid. 
-    sum = 0; left_sum = -10000
+    sum = 0; left_sum = float('-inf')
       
     for i in range(m, l-1, -1) : 
         sum = sum + arr[i] 
@@ -42,7 +60,7 @@ def maxSum(arr, l, m, h) :
       
       
     # Include elements on right of mid 
-    sum = 0; right_sum = -1000
+    sum = 0; right_sum = float('-inf')
     for i in range(m + 1, h + 1) : 
         sum = sum + arr[i] 
           
@@ -65,4 +83,5 @@ for _ in range(1):
   print "list to MSP on", A
    # print B
   print "MSP found", G
+  print "MSP_linear found", MSP_linear(A)
  #   break
@@ -3,15 +3,16 @@ from __future__ import division
 from random import randrange
 import math
 from collections import Counter
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from algorithms.heavy_hitters import majority
+from algorithms.sampling import permutation, shuffle
 #---------------------------------------------------------------------------}}}1
 
 def rand_perm(size):  # {{{
-  p = []
-  while len(p) < size:
-    r = randrange(size)
-    if r not in p:
-      p.append(r)
-  return p
+  # a uniformly random permutation of range(size), by Fisher-Yates in O(size)
+  return permutation(size)
 #----------------------------------------------------------------------------}}}
 def rand_cards(n, max_value=2):  # {{{
   base = []
@@ -22,41 +23,18 @@ def rand_cards(n, max_value=2):  # {{{
     base += [value]*randrange(1,max_reps+1)
   base += [max_value]*(n-len(base))
 
-  perm = rand_perm(n)
-  base_perm = [ base[perm[i]] for i in range(n) ]
-
-  return base_perm
+  # shuffling base in place is the same as reading it through rand_perm(n)
+  return shuffle(base)
 #----------------------------------------------------------------------------}}}
 
-def credit_card(L):
-  recurse_lim = math.ceil(len(L)/4)
-  cands = call(L,recurse_lim)
-  return cands
-
-def call(L,n): # {{{
-  if len(L) <= n:
-    return L
-  cands = []
-  mf = int(math.floor(len(L)/2))
-  mc = int(math.ceil(len(L)/2))
-  cands = (list(overHalf(L,mc)))
-  A = call(L[:mc],n)
-  B = call(L[mc:(len(L))],n)
-
-  return cands
-
-def overHalf(L, n):
-  print "overhalf called"
-  counter = Counter()
-  cands = set()
-  for i in L:
-    counter[i] += 1
-    if counter[i] >= n:
-      if i not in cands:
-        cands.add(i)
-
-  return cands
-
+def credit_card(L): # {{{
+  # Return the list of cards that make up more than half of L: [x] for the
+  # majority card x, or [] if there is none. A Boyer-Moore vote picks the only
+  # possible candidate and a second pass counts it, so this is O(n) time and
+  # O(1) space; see algorithms.heavy_hitters for the more-than-n/k version and
+  # for streams.
+  x = majority(L)
+  return [] if x is None else [x]
 #----------------------------------------------------------------------------}}}
 
 # test your credit_card() solution using something like this
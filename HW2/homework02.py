@@ -3,187 +3,12 @@ from __future__ import division
 import math
 import pdb
 from random import randrange
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from algorithms.heap import Heap, PQ
 #---------------------------------------------------------------------------}}}1
 
-class Heap: # {{{1
-  # A heap data structure. A node n in the tree is a pair n = (k,v), where k is
-  # the key of n and v is the value. The tree is always balanced, and is stored
-  # in a flat list, Heap.nodes.
-  #
-  # if Heap.nodes = [a, b, c, d, e, f, g, h, i, j, k, l, m, n], then this
-  # corresponds to the tree
-  #          ____a____
-  #         /         \
-  #       _b_         _c_
-  #      /   \       /   \
-  #     d     e     f     g
-  #    / \   / \   / \   /
-  #   h   i j   k l   m n
-  #
-  # The functions below are mostly self-explanatory. If H is a heap, then:
-  #   H.__getitem__(index) is run to return H[index],
-  #   H.__delitem__(index) is run to execute del H[index],
-  #   H.__len__ is run to execute len(H)
-  #   H.__str__ is run to execute str(H), print H, etc.
-
-  def __init__(self, initial = []): # {{{
-    self.nodes = []
-    for n in initial:
-      self.add(n)
-  #--------------------------------------------------------------------------}}}
-
-  def _key(self, index):  # {{{
-    return self.nodes[index][0]
-  #--------------------------------------------------------------------------}}}
-
-  def _parent_index(self, index): # {{{
-    # Return the index of the parent of the node at given index. In the example
-    # above, the index of node f is 5, so Heap._parent_index(5) = 2, the index
-    # of the node c.
-
-    return None if index <= 0 else int(math.floor(index - 1 /2))
-  #--------------------------------------------------------------------------}}}
-  def _parent(self, index): # {{{
-    # Return the parent of the node at the given index. In the example above,
-    # the index of node f is 5, so Heap._parent(5) = c. Return the special
-    # python value of None if there is no parent.
-
-    # if no parent
-    return None if index <= 0 else self.nodes[self._parent_index(index)][1]
-  #--------------------------------------------------------------------------}}}
-  def _parent_key(self, index): # {{{
-    # Return the parent of the node at the given index. In the example above,
-    # the index of node f is 5, so Heap._parent_key(5) = 3. Return the special
-    # python value of None if there is no parent.
-
-    # if no parent
-    return None if index <= 0 else ord(self.nodes[self._parent_index(index)][1] - 66)
-
-  def swap(self, ind1, ind2):
-    if (ind1 >= 0) and (ind2 >= 0):
-      temp_node = self.nodes[ind1]
-      self.nodes[ind1] = self.nodes[ind2]
-      self.nodes[ind2] = temp_node
-
-
-
-
-  #--------------------------------------------------------------------------}}}
-  def _heapify_up(self, index): # {{{
-    # heapify_up, as discussed in class and the the book.
-   # if index > 0:
-    #  parent_ind = self._parent_index(index)
-    #  if self._key(index) < self._key(parent_ind):
-     #   self.swap(index,parent_ind)
-    #    self._heapify_up(parent_ind)
-    #pdb.set_trace()
-    if index == 0:
-      return
-    parent_ind = self._parent_index(index)
-    while self._key(parent_ind) > self._key(index):
-      self.swap(index,parent_ind)
-      index = parent_ind
-      parent_ind = self._parent_index(index)
-      if parent_ind == None:
-        break
-      
-
-  #---------------------------------------------------------------------------}}}
-  def add(self, new_node):  # {{{
-    # new_node is a tuple, new_node=(key,value)
-    self.nodes.append(new_node)
-    self._heapify_up(len(self.nodes)-1)
-  #--------------------------------------------------------------------------}}}
-
-  def _child_index(self, index, direct):  # {{{
-    return 2*index + 1 + direct
-  #---------------------------------------------------------------------------}}}
-  def _child(self, index, direct): # {{{
-    child_index = self._child_index(index, direct)
-    if child_index >= len(self.nodes):
-      return None
-    return self.nodes[child_index]
-  #---------------------------------------------------------------------------}}}
-  def _child_key(self, index, direct): # {{{
-    child_index = self._child_index(index, direct)
-    if child_index >= len(self.nodes):
-      return None
-    return self._key(child_index)
-  #---------------------------------------------------------------------------}}}
-  def _heapify_down(self, index): # {{{
-    bottom_level = self._level(len(self.nodes)-1)
-    while self._level(index) < bottom_level:
-      children_keys = [ self._child_key(index, d) for d in [0,1] ]
-      children_keys = [ c for c in children_keys if c != None ]
-      if children_keys == [] or self._key(index) <= min(children_keys):
-        break
-      if children_keys[0] <= children_keys[-1]:
-        min_child_index = self._child_index(index,0)
-      else:
-        min_child_index = self._child_index(index,1)
-      swap = self.nodes[min_child_index]
-      self.nodes[min_child_index] = self.nodes[index]
-      self.nodes[index] = swap
-      index = min_child_index
-  #---------------------------------------------------------------------------}}}
-  def _level(self,index): # {{{
-    return int( math.floor( math.log(index+1) ) )
-  #----------------------------------------------------------------------------}}}
-  def remove(self, index):  # {{{
-    self.nodes[index] = self.nodes[-1]
-    del self.nodes[-1]
-    self._heapify_down(index)
-  #--------------------------------------------------------------------------}}}
-
-  def __getitem__(self, index):  # {{{
-    return self.nodes[index]
-  #--------------------------------------------------------------------------}}}
-  def __delitem__(self, index):  # {{{
-    self.remove(index)
-  #--------------------------------------------------------------------------}}}
-  def __len__(self):  # {{{
-    return len(self.nodes)
-  #--------------------------------------------------------------------------}}}
-  def __str__(self):  # {{{
-    return str(self.nodes)
-  #--------------------------------------------------------------------------}}}
-#----------------------------------------------------------------------------}}}1
-
-class PQ: # {{{1
-  def __init__(self, initial = []): # {{{
-    self.elements = Heap(initial=initial)
-  #--------------------------------------------------------------------------}}}
-
-  def add(self, new_node):  # {{{
-    # Add new_node to the priority queue. The argument new_node is a tuple,
-    # new_node=(key,value)
-    self.elements.add(new_node)
-  #--------------------------------------------------------------------------}}}
-
-  def pop(self): # {{{
-    # Return the *value* (not the key) of the top of the priority queue. If the
-    # top is (k,v), it should return v. Raise an exception if the queue is
-    # empty.
-
-    if not self.elements.nodes:
-      raise IndexError
-    if len(self.elements.nodes) > 1:
-      self.elements.nodes[0] = self.elements.nodes[len(self.elements.nodes) - 1]
-      del self.elements.nodes[-1]
-      self.elements._heapify_down(0)
-    return self.elements.nodes[0][1]
-
-
-  #--------------------------------------------------------------------------}}}
-
-  def __len__(self):  # {{{
-    return len(self.hashes)
-  #--------------------------------------------------------------------------}}}
-  def __str__(self):  # {{{
-    return str(self.nodes)
-  #--------------------------------------------------------------------------}}}
-#----------------------------------------------------------------------------}}}1
-
 I = [ (2,"b"),
       (15,"c"),
       (16,"d"),
@@ -213,9 +38,9 @@ H = Heap(initial=J)
 print "First run:"
 print H
 
-# This should print 
+# This should print (Heap(initial=...) heapifies bottom-up)
 # First run:
-# [(1, 'a'), (2, 'b'), (8, 'f'), (10, 'i'), (3, 'j'), (11, 'l'), (20, 'g'), (15, 'h'), (15, 'c'), (17, 'e'), (7, 'k'), (16, 'd')]
+# [(1, 'f'), (14, 'i'), (11, 'l'), (15, 'c'), (17, 'e'), (16, 'd'), (20, 'g'), (15, 'h'), (345, 'a'), (36, 'j'), (47, 'k'), (45, 'b')]
 
 
 H.add((1,"m"))
@@ -226,21 +51,16 @@ print H
 
 # This should print
 # Second run:
-# [(1, 'a'), (2, 'b'), (1, 'm'), (10, 'i'), (3, 'j'), (8, 'f'), (5, 'o'), (15, 'h'), (15, 'c'), (17, 'e'), (7, 'k'), (16, 'd'), (11, 'l'), (100, 'n'), (20, 'g')]
+# [(1, 'f'), (14, 'i'), (1, 'm'), (15, 'c'), (17, 'e'), (11, 'l'), (5, 'o'), (15, 'h'), (345, 'a'), (36, 'j'), (47, 'k'), (45, 'b'), (16, 'd'), (100, 'n'), (20, 'g')]
 
 
 def sort_with_PQ(L):  # {{{
   # Input is a list L. Return the sorted list. The sort should be linear in the
   # PQ operations. That is, it should run in O(n*O(PQ)).
-  peequ = PQ()
-  sorted_list = []
-  for i in L:
-    new_node = (i,"a")
-    peequ.add(new_node)
-
-  for i in range(0,(len(L)-1)):
-    sorted_list.append(peequ.elements.nodes[i][0])
-  
+  # Building the PQ is O(n) and each of the n pops is O(log n). For an in-place
+  # sort with no per-element allocation, see algorithms.heap.heapsort.
+  peequ = PQ([ (i,i) for i in L ])
+  sorted_list = [ peequ.pop() for _ in range(len(L)) ]
 
   return  sorted_list
 #----------------------------------------------------------------------------}}}
@@ -4,127 +4,20 @@ from collections import deque
 from copy import deepcopy
 from random import randrange
 import pdb
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from algorithms.graph import AdjList, CSRGraph
 # ---------------------------------------------------------------------------}}}1
 
 
-class AdjList:  # {{{1
-    # A class for the adjacency list representation of a graph.
-    # Undirected graphs will have an edge (s,t) if and only if it has edge (t,s).
-    # A directed graph might have edge (s,t) without having edge (t,s).
-
-    # AdjList.adj is the actual adjacency list.
-    # AdjList.directed is a bool indicating whether the graph is directed.
-    # AdjList.nodes is an array of the form range(n).
-
-    # Edges may be specified on initialization or with the add_edge method.
-
-    # If A is an AdjList, then...
-    #   - A[i] is the adjacency list for node i
-    #   - len(A) is the number of nodes in the graph, *not* the number of edges
-    #   - str(A) is a "nicer" version of the adjacency list. It gets run when you
-    #     explicity or implicityly convert A to a string (like with print).
-    # These correspond to the last 3 class methods.
-
-    def __init__(self, num_nodes, edges=[], directed=False):  # {{{
-        self.nodes = range(num_nodes)
-        self.adj = [[] for _ in self.nodes]
-        self.directed = directed
-
-        for (s, t) in edges:
-            self.add_edge(s, t)
-
-        self.sort()
-    # --------------------------------------------------------------------------}}}
-
-    def add_edge(self, s, t, try_directed=True):  # {{{
-        # Adds an edge (s,t). If the graph is undirected, it adds edge (t,s) as well.
-        if t not in self.adj[s]:
-            self.adj[s].append(t)
-
-        if not self.directed and try_directed:
-            self.add_edge(t, s, try_directed=False)
-    # --------------------------------------------------------------------------}}}
-
-    def del_edge(self, s, t, try_directed=True):  # {{{
-        # Deletes an edge (s,t) if it exists. If the graph is undirected, it deletes
-        # the edge (t,s) as well.
-        try:
-            t_index = self.adj[s].index(t)
-            del self.adj[s][t_index]
-        except ValueError:
-            pass
-
-        if not self.directed and try_directed:
-            self.del_edge(t, s, try_directed=False)
-    # --------------------------------------------------------------------------}}}
-
-    def has_edge(self, s, t):  # {{{
-        return t in self.adj[s]
-    # --------------------------------------------------------------------------}}}
-
-    def degree(self, s):  # {{{
-        # return the degree of the node s
-        if s > len(self.nodes) - 1:
-            return -1
-
-        deg = 0
-        elems = []
-        if(self.directed):
-            for i in range(len(self.nodes)):
-                for j in range(len(self.adj[i])):
-                    if i == s:
-                        deg += 1
-                    if self.adj[i][j] == s:
-                        deg += 1
-        else:
-            deg = len(self.adj[s])
-
-            for i in self.adj[s]:
-                elems.append(i)
-
-            for i in range(len(self.adj) - 1):
-                for j in range(len(self.adj[i]) - 1):
-                    if i not in elems:
-                        if self.adj[i][j] == s:
-                            deg += 1
-
-        return deg
-    # --------------------------------------------------------------------------}}}
-
-    def sort(self):  # {{{
-        # Sort the adjacency lists
-        for n in self.nodes:
-            self.adj[n] = sorted(self.adj[n])
-    # --------------------------------------------------------------------------}}}
-
-    def __getitem__(self, node):  # {{{
-        return self.adj[node]
-    # --------------------------------------------------------------------------}}}
-
-    def __len__(self):  # {{{
-        return len(self.nodes)
-    # --------------------------------------------------------------------------}}}
-
-    def __str__(self):  # {{{
-        ret = ""
-        for n in self.nodes:
-            neighbors = [str(i) for i in self.adj[n]]
-            ret += str(n) + ": " + " ".join(neighbors) + "\n"
-        return ret[:-1]
-    # --------------------------------------------------------------------------}}}
-# ----------------------------------------------------------------------------}}}1
-
-
 def randgraph(num_nodes):  # {{{
     num_edges = int(num_nodes*2**0.5)
 
-    G = AdjList(num_nodes)
-    for _ in xrange(num_edges):
-        new_edge = (randrange(num_nodes), randrange(num_nodes))
-        if not G.has_edge(*new_edge):
-            G.add_edge(*new_edge)
-    G.sort()
-    return G
+    # duplicate edges are dropped when the CSRGraph is built
+    edges = [(randrange(num_nodes), randrange(num_nodes))
+             for _ in xrange(num_edges)]
+    return CSRGraph(num_nodes, edges)
 # ----------------------------------------------------------------------------}}}
 
 
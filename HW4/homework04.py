@@ -5,107 +5,12 @@ from random import randrange
 from collections import deque
 
 from sys import *
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from algorithms.graph import AdjList, CSRGraph
+from algorithms.dfs import find_cycle
 #---------------------------------------------------------------------------}}}1
-class AdjList: # {{{1
-  # A class for the adjacency list representation of a graph.
-  # Undirected graphs will have an edge (s,t) if and only if it has edge (t,s).
-  # A directed graph might have edge (s,t) without having edge (t,s).
-
-  # AdjList.adj is the actual adjacency list.
-  # AdjList.rev is the adjacency list of the reverse graph
-  # AdjList.directed is a bool indicating whether the graph is directed.
-  # AdjList.nodes is an array of the form range(n).
-
-  # Edges may be specified on initialization or with the add_edge method.
-
-  # If A is an AdjList, then...
-  #   - A[i] is the adjacency list for node i
-  #   - len(A) is the number of nodes in the graph, *not* the number of edges
-  #   - str(A) is a "nicer" version of the adjacency list. It gets run when you
-  #     explicity or implicityly convert A to a string (like with print).
-  # These correspond to the last 3 class methods.
-
-  def __init__(self, num_nodes, edges = [], directed = False): # {{{
-    self.nodes = range(num_nodes)
-    self.adj = [ [] for _ in self.nodes ]
-    self.rev = [ [] for _ in self.nodes ]
-    self.directed = directed
-
-    for (s,t) in edges:
-      self.add_edge(s,t)
-
-    self.sort()
-  #--------------------------------------------------------------------------}}}
-
-  def add_edge(self, s, t, try_directed = True): # {{{
-  # Adds an edge (s,t). If the graph is undirected, it adds edge (t,s) as well.
-    if t not in self.adj[s]:
-      self.adj[s].append(t)
-      self.rev[t].append(s)
-
-    if not self.directed and try_directed:
-      self.add_edge(t, s, try_directed = False)
-  #--------------------------------------------------------------------------}}}
-  def del_edge(self, s, t, try_directed = True): # {{{
-  # Deletes an edge (s,t) if it exists. If the graph is undirected, it deletes
-  # the edge (t,s) as well.
-    try:
-      t_index = self.adj[s].index(t)
-      del self.adj[s][t_index]
-      s_index = self.rev[t].index(s)
-      del self.adj[t][s_index]
-    except ValueError:
-      pass
-
-    if not self.directed and try_directed:
-      self.del_edge(t, s, try_directed = False)
-  #--------------------------------------------------------------------------}}}
-
-  def has_edge(self, s, t): # {{{
-    return t in self.adj[s]
-  #--------------------------------------------------------------------------}}}
-  def has_edge_rev(self, s, t): # {{{
-    return t in self.rev[s]
-  #--------------------------------------------------------------------------}}}
-  def degree(self, s): # {{{
-    if not self.directed:
-      return len(self.adj[s])
-
-    out_deg = len(self.adj[s])
-    in_deg = len(self.rev[s])
-    return out_deg + in_deg
-  #--------------------------------------------------------------------------}}}
-  def sort(self): # {{{
-    # Sort the adjacency lists
-    for n in self.nodes:
-      self.adj[n] = sorted(self.adj[n])
-      self.rev[n] = sorted(self.rev[n])
-  #--------------------------------------------------------------------------}}}
-
-  def reverse(self): # {{{
-    # returns reverse graph
-    rev_adjlist = AdjList(self.nodes, directed = self.directed)
-    rev_adjlist.adj = deepcopy(self.adj)
-    rev_adjlist.rev = deepcopy(self.rev)
-
-    return rev_adjlist
-  #--------------------------------------------------------------------------}}}
-
-  def __getitem__(self, node):  # {{{
-    return self.adj[node]
-  #--------------------------------------------------------------------------}}}
-  def __len__(self):  # {{{
-    return len(self.nodes)
-  #--------------------------------------------------------------------------}}}
-  def __str__(self):  # {{{
-    ret = ""
-    for n in self.nodes:
-      neighbors = [ str(i) for i in self.adj[n] ]
-      ret += str(n) + ": " + " ".join(neighbors) + "\n"
-    return ret[:-1]
-  #--------------------------------------------------------------------------}}}
-#----------------------------------------------------------------------------}}}1
-
 def BFS(G, s):  # {{{
   # Breadth First search for G and s. Returns a BFS tree rooted at s. The data
   # structure deque is used. It is something like a symmetric queue, with O(1)
@@ -181,55 +86,19 @@ def findCycle(G): # {{{
   # 0-cycle and you should return [1]. Things like 1 -- 2 -- 1 don't count as
   # cycles since you have to take the same edge back to 1. 
 
-  # You may want to base your algorithm on the BFS function above, and I suggest
-  # using the functions predecessors and common_ancestor_paths.
-  # Mark all the vertices as not visited
-        seen =[False]*(len(G.nodes))
-        cyc = []
-        # Call the recursive helper function to detect cycle in different
-        #DFS trees
-        for i in range(len(G.nodes)):
-            if seen[i] ==False:
-              isCyclic(G,i,seen,-1,cyc)
-
-        if cyc != []:
-          cyc.pop() #helper function added node where cycle began twice. Popped to remove       
-          return cyc
-        else:
-          return None
-
- 
+  # This is an iterative DFS, see algorithms.dfs: a back edge u -> v closes
+  # the cycle v -> ... -> u of tree edges, and deep graphs don't hit the
+  # recursion limit.
+  return find_cycle(G)
 #----------------------------------------------------------------------------}}}
 
-def isCyclic(G,v,seen,parent,cyc):
- 
-        #Mark the current node as seen
-        seen[v]= True
-        #Recur for all the vertices adjacent to this vertex
-        for i in G.adj[v]:
-            # If the node is not seen then recurse on it
-            if  seen[i]==False : 
-                if(isCyclic(G,i,seen,v,cyc)):
-                    cyc.append(i)
-                    return cyc
-            # If an adjacent vertex is seen and not the parent of the current index then there is a cycle
-            elif  parent!=i:
-                cyc.append(i)
-                return cyc
-         
-        return None
-
 def randgraph(num_nodes):  # {{{
   phi = (1 + 5**0.5)/2
   num_edges = int( num_nodes*phi )
 
-  G = AdjList(num_nodes)
-  for _ in xrange(num_edges):
-    new_edge = (randrange(num_nodes), randrange(num_nodes))
-    if not G.has_edge( *new_edge ):
-      G.add_edge( *new_edge )
-  G.sort()
-  return G
+  # duplicate edges are dropped when the CSRGraph is built
+  edges = [ (randrange(num_nodes), randrange(num_nodes)) for _ in xrange(num_edges) ]
+  return CSRGraph(num_nodes, edges)
 #----------------------------------------------------------------------------}}}
 
 # You can check your findCycle implementation by running this several times and
@@ -5,155 +5,25 @@ from copy import deepcopy
 from itertools import *
 import math
 from random import randrange
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from algorithms.graph import AdjList, CSRGraph
+from algorithms.cycles import kahn_residue, find_directed_cycle, simple_cycles
 #---------------------------------------------------------------------------}}}1
 
-class AdjList: # {{{1
-  # A class for the adjacency list representation of a graph.
-  # Undirected graphs will have an edge (s,t) if and only if it has edge (t,s).
-  # A directed graph might have edge (s,t) without having edge (t,s).
-
-  # AdjList.adj is the actual adjacency list.
-  # AdjList.rev is the adjacency list of the reverse graph
-  # AdjList.directed is a bool indicating whether the graph is directed.
-  # AdjList.nodes is an array of the form range(n).
-
-  # Edges may be specified on initialization or with the add_edge method.
-
-  # If A is an AdjList, then...
-  #   - A[i] is the adjacency list for node i
-  #   - len(A) is the number of nodes in the graph, *not* the number of edges
-  #   - str(A) is a "nicer" version of the adjacency list. It gets run when you
-  #     explicity or implicityly convert A to a string (like with print).
-  # These correspond to the last 3 class methods.
-
-  def __init__(self, num_nodes, edges = [], directed = False): # {{{
-    self.nodes = range(num_nodes)
-    self.adj = [ [] for _ in self.nodes ]
-    self.rev = [ [] for _ in self.nodes ]
-    self.directed = directed
-
-    for (s,t) in edges:
-      self.add_edge(s,t)
-
-    self.sort()
-  #--------------------------------------------------------------------------}}}
-
-  def add_edge(self, s, t, try_directed = True): # {{{
-  # Adds an edge (s,t). If the graph is undirected, it adds edge (t,s) as well.
-    if t not in self.adj[s]:
-      self.adj[s].append(t)
-      self.rev[t].append(s)
-
-    if not self.directed and try_directed:
-      self.add_edge(t, s, try_directed = False)
-  #--------------------------------------------------------------------------}}}
-  def del_edge(self, s, t, try_directed = True): # {{{
-  # Deletes an edge (s,t) if it exists. If the graph is undirected, it deletes
-  # the edge (t,s) as well.
-    try:
-      t_index = self.adj[s].index(t)
-      del self.adj[s][t_index]
-      s_index = self.rev[t].index(s)
-      del self.rev[t][s_index]
-    except ValueError:
-      pass
-
-    if not self.directed and try_directed:
-      self.del_edge(t, s, try_directed = False)
-  #--------------------------------------------------------------------------}}}
-
-  def has_edge(self, s, t): # {{{
-    return t in self.adj[s]
-  #--------------------------------------------------------------------------}}}
-  def has_edge_rev(self, s, t): # {{{
-    return t in self.rev[s]
-  #--------------------------------------------------------------------------}}}
-  def is_path(self, path): # {{{
-    if not path:    # if path is [] or None
-      return False
-
-    for i in range(1, len(path)):
-      if not self.has_edge(path[i-1], path[i]):
-        return False
-    return True
-#----------------------------------------------------------------------------}}}
-  def is_cycle(self, path): # {{{
-    # in an undirected graph 1-cycles don't count
-    if not self.directed and len(path) == 2:
-      return False
-
-    #print "running is cycle on \n", path
-
-    return self.is_path(list(path) + [path[0]])
-#----------------------------------------------------------------------------}}}
-
-  def in_degree(self, s): # {{{
-    return len(self.rev[s])
-  #--------------------------------------------------------------------------}}}
-  def out_degree(self, s): # {{{
-    return len(self.adj[s])
-  #--------------------------------------------------------------------------}}}
-  def degree(self, s): # {{{
-    if not self.directed:
-      return self.out_degree(s)
-
-    return self.out_degree(s) + self.in_degree(s)
-  #--------------------------------------------------------------------------}}}
-
-  def sort(self): # {{{
-    # Sort the adjacency lists
-    for n in self.nodes:
-      self.adj[n] = sorted(self.adj[n])
-      self.rev[n] = sorted(self.rev[n])
-  #--------------------------------------------------------------------------}}}
-  def reverse(self): # {{{
-    # returns reverse graph
-    rev_adjlist = AdjList(len(self.nodes), directed = self.directed)
-    rev_adjlist.adj = deepcopy(self.rev)
-    rev_adjlist.rev = deepcopy(self.adj)
-
-    return rev_adjlist
-  #--------------------------------------------------------------------------}}}
-
-  def __getitem__(self, node):  # {{{
-    return self.adj[node]
-  #--------------------------------------------------------------------------}}}
-  def __len__(self):  # {{{
-    return len(self.nodes)
-  #--------------------------------------------------------------------------}}}
-  def __str__(self):  # {{{
-    ret = ""
-    for n in self.nodes:
-      neighbors = [ str(i) for i in self.adj[n] ]
-      ret += str(n) + ": " + " ".join(neighbors) + "\n"
-    return ret[:-1]
-  #--------------------------------------------------------------------------}}}
-#----------------------------------------------------------------------------}}}1
-
 def randgraph(num_nodes, directed=False):  # {{{
   phi = (1 + 5**0.5)/2
   num_edges = int( num_nodes*phi )
 
-  G = AdjList(num_nodes, directed=directed)
-  for _ in xrange(num_edges):
-    new_edge = (randrange(num_nodes), randrange(num_nodes))
-    G.add_edge( *new_edge )
-  G.sort()
-  return G
+  edges = [ (randrange(num_nodes), randrange(num_nodes)) for _ in xrange(num_edges) ]
+  return CSRGraph(num_nodes, edges, directed=directed)
 #----------------------------------------------------------------------------}}}
 def topological_sort(G):  # {{{
   # Return a topological sort of G if it exists. Your algorithm should be
   # *linear* in (number of vertices + number of edges).
-  S = []
-  in_degrees = [ G.in_degree(s) for s in G.nodes ]
-  in_degrees_0 = [ s for s in G.nodes if in_degrees[s] == 0 ]
-  while len(in_degrees_0) != 0:
-    v = in_degrees_0.pop()
-    S.append(v)
-    for u in G[v]:
-      in_degrees[u] -= 1
-      if in_degrees[u] == 0:
-        in_degrees_0.append(u)
+  # Kahn's algorithm, see algorithms.cycles.kahn_residue
+  S, _ = kahn_residue(G)
   return S
 #----------------------------------------------------------------------------}}}
 def is_DAG(G):  # {{{
@@ -165,14 +35,15 @@ def rand_intervals(number, size = None): # {{{
   if size == None:
     size = int(math.ceil(number * 2**0.5))
 
+  # the set makes the duplicate check O(1) instead of a scan of I
   I = []
-  count = 0
-  while count < number:
+  seen = set()
+  while len(I) < number:
     start = randrange(size-1)
     finish = randrange(start+1, size)
-    if (start,finish) not in I:
+    if (start,finish) not in seen:
+      seen.add( (start,finish) )
       I.append( (start,finish) )
-      count += 1
   return I
 #----------------------------------------------------------------------------}}}
 def sort_intervals_finish(I):  # {{{
@@ -221,37 +92,23 @@ def filter_list(full_list, excludes):
 #----------------------------------------------------------------------------}}}
 
 
-def findCycleDirHelper(G):  # {{{
+def findCycleDir(G):  # {{{
   # By modifying the topological sort algorithm, find a cycle in the directed
   # graph G. Your algorithm should be linear in the nodes and edges of G. If G
   # is acyclic, return None. If G has a cycle, say 
   #   a1 -> a2 -> ... -> ak -> a1,
   # then return the list [a1, a2, ..., ak]. Loops of the form a1 -> a1 count as
   # 1-cycles, and 2-cycles of the form a1 -> a2 -> a1 count as well.
-  S = []
-  in_degrees = [ G.in_degree(s) for s in G.nodes ]
-  in_degrees_0 = [ s for s in G.nodes if in_degrees[s] == 0 ]
-  while len(in_degrees_0) != 0:
-    v = in_degrees_0.pop()
-    S.append(v)
-    for u in G[v]:
-      in_degrees[u] -= 1
-      if in_degrees[u] == 0:
-        in_degrees_0.append(u)
-  return list(filter(lambda x: x not in set(S), G.nodes))
-
-def findCycleDir(G):
-  non_top_sort = findCycleDirHelper(G)
-  out_degrees_0 = [ s for s in G.nodes if G.out_degree(s) == 0 or G.in_degree(s) == 0]
-  possible_cycle_list = list(filter(lambda x: x not in set(out_degrees_0), non_top_sort))
 
-
-  for i in range(0,len(possible_cycle_list) -1 ):
-    for j in range(i+1,len(possible_cycle_list) -1 ):
-      if G.is_cycle(possible_cycle_list[i:j]):
-        return possible_cycle_list[i:j]
-
-  return []
+  # The nodes topological_sort can't remove all have a predecessor among
+  # themselves, so walking predecessors inside them closes a cycle; see
+  # algorithms.cycles.find_directed_cycle.
+  return find_directed_cycle(G)
+#----------------------------------------------------------------------------}}}
+def findAllCyclesDir(G):  # {{{
+  # Generate every elementary cycle of G, in the format of findCycleDir
+  # (Johnson's algorithm).
+  return simple_cycles(G)
 #----------------------------------------------------------------------------}}}
 def getSecond(val): 
     return val[1]
@@ -295,7 +152,7 @@ def interval_partitioning(I): # {{{
 #C = findCycleDir(A)
 #print A
 #print C
-#print A.is_cycle(C)
+#print C is None or A.is_cycle(C)
 
 ## you can run this to be more certain that your findCycleDir function works in
 ## general
@@ -0,0 +1,29 @@
+# Shared data structures and algorithms used by the homework scripts.
+#
+#   algorithms.graph -- AdjList and the compressed sparse row CSRGraph
+#   algorithms.heap -- d-ary Heap, PairingHeap, the priority queue PQ, heapsort,
+#     the streaming merge_sorted, nsmallest and nlargest, and the indexed
+#     priority_dict
+#   algorithms.shortest_paths -- heap-based Dijkstra and point to point
+#     shortest_path (bidirectional Dijkstra or A*)
+#   algorithms.path_service -- batched queries with an LRU cache of trees
+#   algorithms.contraction -- contraction hierarchies for repeated queries
+#   algorithms.mst -- Prim and Kruskal minimum spanning forests
+#   algorithms.union_find -- array-backed disjoint sets with batch unions
+#   algorithms.dfs -- iterative depth first search events, find_cycle and
+#     topological_sort
+#   algorithms.cycles -- Kahn residue cycle witness and Johnson's simple_cycles
+#   algorithms.scc -- iterative Tarjan strongly connected components and the
+#     condensation DAG
+#   algorithms.hamiltonian -- linear Hamiltonian paths of DAGs and Held-Karp
+#   algorithms.generators -- seeded random DAGs, and vectorized (numpy)
+#     Erdos-Renyi, Barabasi-Albert, random geometric and grid graphs
+#   algorithms.primes -- bytearray and segmented sieves, primes_in_range, prime_pi
+#   algorithms.sums -- Faulhaber closed forms for polynomial range sums
+#   algorithms.msp -- Kadane maximum subarray, streamed by chunks, and the
+#     windowed max_window_sum; segment summaries for parallel_msp and the
+#     segment tree MSPTree
+#   algorithms.heavy_hitters -- Boyer-Moore majority, Misra-Gries and the
+#     CountMinSketch
+#   algorithms.sampling -- Fisher-Yates shuffles, reservoir and weighted sampling
+#   algorithms.bench_heaps -- timings of the PQ backends on Dijkstra and Prim
@@ -0,0 +1,101 @@
+# Compare the PQ backends (binary, 4-ary and 8-ary Heap, PairingHeap) on the
+# Dijkstra and Prim workloads from HW8. Run it with
+#
+#   python -m algorithms.bench_heaps [num_nodes ...]
+#
+# imports {{{1
+from __future__ import division, print_function
+from random import Random
+from timeit import default_timer
+import sys
+
+from algorithms.graph import CSRGraph
+from algorithms.heap import PQ
+#---------------------------------------------------------------------------}}}1
+
+BACKENDS = [ ("binary", dict(arity=2)),
+             ("4-ary", dict(arity=4)),
+             ("8-ary", dict(arity=8)),
+             ("pairing", dict(pairing=True)) ]
+
+def rand_weight_graph(num_nodes, seed = 0):  # {{{
+  # The random weighted graphs of HW8: about phi*n edges with weights between
+  # n/2 and 3n/2, returned as a weighted CSRGraph.
+  rng = Random(seed)
+  phi = (1 + 5**0.5)/2
+  num_edges = int(num_nodes*phi)
+  min_weight = num_nodes // 2
+  max_weight = (num_nodes * 3) // 2
+
+  edges = [ (rng.randrange(num_nodes), rng.randrange(num_nodes))
+            for _ in range(num_edges) ]
+  weights = [ rng.randint(min_weight, max_weight) for _ in edges ]
+  return CSRGraph(num_nodes, edges, weights=weights)
+#----------------------------------------------------------------------------}}}
+
+def dijkstra_pq(G, s, **pq_args): # {{{
+  # Dijkstra with a PQ that has no decrease-key: a node is pushed again every
+  # time its distance improves, and outdated entries are skipped when popped.
+  dist = [ float("inf") for _ in G.nodes ]
+  done = [ False for _ in G.nodes ]
+  offsets, targets, weights = G.offsets, G.targets, G.weights
+  dist[s] = 0
+  H = PQ(**pq_args)
+  H.add( (0, s) )
+  while len(H) != 0:
+    u = H.pop()
+    if done[u]:
+      continue
+    done[u] = True
+    du = dist[u]
+    for i in range(offsets[u], offsets[u+1]):
+      v = targets[i]
+      d = du + weights[i]
+      if d < dist[v]:
+        dist[v] = d
+        H.add( (d, v) )
+  return dist
+#----------------------------------------------------------------------------}}}
+def prim_pq(G, s, **pq_args): # {{{
+  # Lazy Prim: the same push-again scheme as dijkstra_pq, with the edge weight
+  # as the key. Returns the total weight of the tree containing s.
+  best = [ float("inf") for _ in G.nodes ]
+  done = [ False for _ in G.nodes ]
+  offsets, targets, weights = G.offsets, G.targets, G.weights
+  best[s] = 0
+  total = 0
+  H = PQ(**pq_args)
+  H.add( (0, s) )
+  while len(H) != 0:
+    u = H.pop()
+    if done[u]:
+      continue
+    done[u] = True
+    total += best[u]
+    for i in range(offsets[u], offsets[u+1]):
+      v = targets[i]
+      if not done[v] and weights[i] < best[v]:
+        best[v] = weights[i]
+        H.add( (weights[i], v) )
+  return total
+#----------------------------------------------------------------------------}}}
+
+def bench(sizes, repeat = 3): # {{{
+  # Print the best of repeat running times for each workload and backend.
+  print("%-10s %-9s %10s %10s" % ("nodes", "backend", "dijkstra", "prim"))
+  for n in sizes:
+    G = rand_weight_graph(n)
+    for (name, pq_args) in BACKENDS:
+      times = []
+      for algorithm in (dijkstra_pq, prim_pq):
+        best = float("inf")
+        for _ in range(repeat):
+          start = default_timer()
+          algorithm(G, 0, **pq_args)
+          best = min(best, default_timer() - start)
+        times.append(best)
+      print("%-10d %-9s %9.4fs %9.4fs" % (n, name, times[0], times[1]))
+#----------------------------------------------------------------------------}}}
+
+if __name__ == "__main__":
+  bench([ int(a) for a in sys.argv[1:] ] or [10**3, 10**4, 10**5])
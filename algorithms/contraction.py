@@ -0,0 +1,263 @@
+# imports {{{1
+from __future__ import division
+from array import array
+from heapq import heappush, heappop
+import pickle
+
+from algorithms.graph import CSRGraph, weighted_graph
+from algorithms.heap import priority_dict
+#---------------------------------------------------------------------------}}}1
+
+class ContractionHierarchy: # {{{1
+  # A contraction hierarchy for fast point to point shortest paths on a static
+  # weighted graph. It is built once and then answers queries with two small
+  # upward searches instead of a search over the whole graph.
+  #
+  # Preprocessing contracts the nodes one at a time, least important first.
+  # Contracting v removes it from the remaining graph, and for each pair of
+  # remaining neighbors u -> v -> x it adds a shortcut edge u -> x of the same
+  # weight, unless a "witness" path from u to x avoiding v is no longer. A
+  # node's importance is its edge difference (shortcuts it would add minus
+  # edges it would remove) plus the number of its already contracted
+  # neighbors, kept up to date lazily.
+  #
+  # ContractionHierarchy.rank[v] -- position of v in the contraction order
+  # ContractionHierarchy.up -- CSRGraph of the edges (u,x), original or
+  #   shortcut, with rank[u] < rank[x]
+  # ContractionHierarchy.down -- CSRGraph of the edges (x,u), stored as (u,x),
+  #   with rank[u] < rank[x], for the backward search from the target
+  # ContractionHierarchy.middle -- dictionary from each shortcut (u,x) to the
+  #   node it skips, used to unpack paths
+  #
+  # A query runs Dijkstra upward from s in up and upward from t in down; the
+  # shortest path is the best sum over the nodes both searches reach.
+
+  def __init__(self, G, w = None, witness_limit = 64): # {{{
+    # G, w are as for algorithms.shortest_paths.dijkstra. witness_limit bounds
+    # the nodes settled by each witness search; a smaller limit builds faster
+    # but may add unnecessary shortcuts (the answers stay exact).
+    if G is None:   # used by ContractionHierarchy.load
+      return
+    G = weighted_graph(G, w)
+    self.directed = G.directed
+    self.witness_limit = witness_limit
+    self._contract(G)
+  #--------------------------------------------------------------------------}}}
+
+  def _contract(self, G): # {{{
+    n = len(G)
+    # remaining graph as dictionaries: out_w[u][x] and in_w[x][u] are the
+    # weight of u -> x. Parallel edges keep the smaller weight.
+    out_w = [ {} for _ in G.nodes ]
+    in_w = [ {} for _ in G.nodes ]
+    for u in G.nodes:
+      for (x, wt) in G.weighted(u):
+        if u != x and wt < out_w[u].get(x, float("inf")):
+          out_w[u][x] = wt
+          in_w[x][u] = wt
+    self._out_w, self._in_w = out_w, in_w
+    self.middle = {}
+
+    # every edge, original or shortcut, in the order it is found
+    edges = [ (u, x) for u in G.nodes for x in out_w[u] ]
+    weights = [ out_w[u][x] for (u, x) in edges ]
+
+    contracted_neighbors = [ 0 for _ in G.nodes ]
+    H = priority_dict( (v, self._priority(v, 0)) for v in G.nodes )
+    rank = array('i', [0]) * n
+    order = 0
+    while H:
+      v = H.pop()
+      shortcuts = self._shortcuts(v)
+      # lazy update: v's priority may have gone up since it was computed
+      if H:
+        new_priority = self._priority(v, contracted_neighbors[v], shortcuts)
+        if new_priority > H[H.peek()]:
+          H[v] = new_priority
+          continue
+
+      for (u, x, wt) in shortcuts:
+        out_w[u][x] = wt
+        in_w[x][u] = wt
+        self.middle[(u, x)] = v
+        edges.append( (u, x) )
+        weights.append(wt)
+
+      rank[v] = order
+      order += 1
+      for u in set(in_w[v]) | set(out_w[v]):
+        contracted_neighbors[u] += 1
+        out_w[u].pop(v, None)
+        in_w[u].pop(v, None)
+        if u in H:
+          H[u] = self._priority(u, contracted_neighbors[u])
+      out_w[v], in_w[v] = {}, {}
+
+    del self._out_w, self._in_w
+    self.rank = rank
+
+    # Split every edge (original or shortcut) into the two upward graphs. The
+    # CSRGraph keeps the smallest weight of any parallel edges.
+    up_edges, up_weights, down_edges, down_weights = [], [], [], []
+    for ((u, x), wt) in zip(edges, weights):
+      if rank[u] < rank[x]:
+        up_edges.append( (u, x) )
+        up_weights.append(wt)
+      else:
+        down_edges.append( (x, u) )
+        down_weights.append(wt)
+    self.up = CSRGraph(n, up_edges, directed=True, weights=up_weights)
+    self.down = CSRGraph(n, down_edges, directed=True, weights=down_weights)
+  #--------------------------------------------------------------------------}}}
+
+  def _shortcuts(self, v): # {{{
+    # The shortcuts (u, x, weight) needed to contract v from the remaining
+    # graph.
+    out_w, in_w = self._out_w, self._in_w
+    shortcuts = []
+    if not out_w[v]:
+      return shortcuts
+    max_out = max(out_w[v].values())
+    for (u, wt_u) in in_w[v].items():
+      targets = set(x for x in out_w[v] if x != u)
+      if not targets:
+        continue
+      dist = self._witness_search(u, v, wt_u + max_out, targets)
+      for x in targets:
+        wt = wt_u + out_w[v][x]
+        if dist.get(x, float("inf")) > wt:
+          shortcuts.append( (u, x, wt) )
+    return shortcuts
+  #--------------------------------------------------------------------------}}}
+  def _witness_search(self, s, avoid, max_dist, targets): # {{{
+    # Dijkstra from s in the remaining graph without the node avoid. It stops
+    # once every node in targets is settled, past distance max_dist, or after
+    # witness_limit settled nodes. The searches are small and run very often,
+    # so they use heapq with lazy deletion rather than a priority_dict.
+    out_w = self._out_w
+    dist = {s: 0}
+    H = [ (0, s) ]
+    remaining = len(targets)
+    settled = 0
+    while H and settled < self.witness_limit:
+      du, u = heappop(H)
+      if du > dist[u]:
+        continue    # outdated entry
+      if du > max_dist:
+        break
+      settled += 1
+      if u in targets:
+        remaining -= 1
+        if remaining == 0:
+          break
+      for (x, wt) in out_w[u].items():
+        if x == avoid:
+          continue
+        d = du + wt
+        if d < dist.get(x, float("inf")):
+          dist[x] = d
+          heappush(H, (d, x))
+    return dist
+  #--------------------------------------------------------------------------}}}
+  def _priority(self, v, contracted_neighbors, shortcuts = None): # {{{
+    # edge difference plus the number of contracted neighbors
+    if shortcuts is None:
+      shortcuts = self._shortcuts(v)
+    removed = len(self._in_w[v]) + len(self._out_w[v])
+    return len(shortcuts) - removed + contracted_neighbors
+  #--------------------------------------------------------------------------}}}
+
+  def query(self, s, t): # {{{
+    # Return (path, cost) for a shortest path from s to t in the original
+    # graph, or (None, inf) if t can't be reached from s.
+    inf = float("inf")
+    dist = [ {s: 0}, {t: 0} ]
+    pred = [ {s: -1}, {t: -1} ]
+    heaps = [ priority_dict({s: 0}), priority_dict({t: 0}) ]
+    graphs = [ self.up, self.down ]
+    best, meet = (0, s) if s == t else (inf, None)
+
+    # Both searches only go up, so neither can stop at the first meeting
+    # node; a side is done once its smallest key reaches the best cost.
+    while True:
+      live = [ i for i in (0, 1) if heaps[i] and heaps[i][heaps[i].peek()] < best ]
+      if not live:
+        break
+      side = min(live, key=lambda i: heaps[i][heaps[i].peek()])
+      H, d_side, d_other = heaps[side], dist[side], dist[1-side]
+      G = graphs[side]
+      u = H.pop()
+      du = d_side[u]
+      if u in d_other and du + d_other[u] < best:
+        best, meet = du + d_other[u], u
+      for i in range(G.offsets[u], G.offsets[u+1]):
+        x = G.targets[i]
+        d = du + G.weights[i]
+        if d < d_side.get(x, inf):
+          d_side[x] = d
+          pred[side][x] = u
+          H[x] = d
+          if x in d_other and d + d_other[x] < best:
+            best, meet = d + d_other[x], x
+
+    if meet is None:
+      return None, inf
+
+    # the path in the hierarchy, s -> meet -> t, with shortcuts unpacked
+    path = []
+    u = meet
+    while u != -1:
+      path.append(u)
+      u = pred[0][u]
+    path.reverse()
+    u = pred[1][meet]
+    while u != -1:
+      path.append(u)
+      u = pred[1][u]
+    return self._unpack(path), best
+  #--------------------------------------------------------------------------}}}
+  def distance(self, s, t): # {{{
+    return self.query(s, t)[1]
+  #--------------------------------------------------------------------------}}}
+  def _unpack(self, path): # {{{
+    # Replace every shortcut (u,x) in path by the two edges u -> middle -> x,
+    # until only original edges are left.
+    ret = [ path[0] ]
+    stack = [ (path[i], path[i+1]) for i in range(len(path) - 2, -1, -1) ]
+    while stack:
+      (u, x) = stack.pop()
+      v = self.middle.get((u, x))
+      if v is None:
+        ret.append(x)
+      else:
+        stack.append( (v, x) )
+        stack.append( (u, v) )
+    return ret
+  #--------------------------------------------------------------------------}}}
+
+  def save(self, filename): # {{{
+    # Write the preprocessed hierarchy to filename.
+    data = dict(directed = self.directed,
+                witness_limit = self.witness_limit,
+                rank = self.rank,
+                middle = self.middle,
+                up = (self.up.offsets, self.up.targets, self.up.weights),
+                down = (self.down.offsets, self.down.targets, self.down.weights))
+    with open(filename, "wb") as f:
+      pickle.dump(data, f, 2)
+  #--------------------------------------------------------------------------}}}
+  @classmethod
+  def load(cls, filename): # {{{
+    # Read a hierarchy written by ContractionHierarchy.save.
+    with open(filename, "rb") as f:
+      data = pickle.load(f)
+    CH = cls(None)
+    CH.directed = data["directed"]
+    CH.witness_limit = data["witness_limit"]
+    CH.rank = data["rank"]
+    CH.middle = data["middle"]
+    CH.up = CSRGraph.from_arrays(*data["up"], directed = True)
+    CH.down = CSRGraph.from_arrays(*data["down"], directed = True)
+    return CH
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
@@ -0,0 +1,140 @@
+# imports {{{1
+from __future__ import division
+from array import array
+from collections import defaultdict
+
+from algorithms.scc import strongly_connected_components, tarjan
+from algorithms.scc import components as scc_components
+#---------------------------------------------------------------------------}}}1
+
+def kahn_residue(G): # {{{
+  # Kahn's topological sort of the directed graph G: repeatedly remove a node
+  # of in-degree 0. Returns (order, in_degrees), where order is the list of
+  # removed nodes and in_degrees the array('i') of in-degrees that are left.
+  # G is a DAG exactly when every node was removed. Otherwise the residue,
+  # the nodes v with in_degrees[v] > 0, is the part of G that is on or
+  # downstream of a cycle, and in_degrees[v] counts v's predecessors in it.
+  order = []
+  in_degrees = G.in_degrees()
+  in_degrees_0 = [ s for s in G.nodes if in_degrees[s] == 0 ]
+  while len(in_degrees_0) != 0:
+    v = in_degrees_0.pop()
+    order.append(v)
+    for u in G[v]:
+      in_degrees[u] -= 1
+      if in_degrees[u] == 0:
+        in_degrees_0.append(u)
+  return order, in_degrees
+#----------------------------------------------------------------------------}}}
+def find_directed_cycle(G): # {{{
+  # Return a cycle [a1, a2, ..., ak] of the directed graph G, with edges
+  # a1 -> a2 -> ... -> ak -> a1, or None if G is acyclic. A loop a1 -> a1 is
+  # the 1-cycle [a1]. O(V+E).
+  #
+  # Every node of the Kahn residue has a predecessor in the residue, so
+  # following predecessors from any residue node never leaves it and must
+  # come back to a node already on the walk; that part of the walk, read
+  # backwards, is a cycle.
+  if not G.directed:
+    raise ValueError("find_directed_cycle needs a directed graph")
+  order, in_degrees = kahn_residue(G)
+  if len(order) == len(G):
+    return None
+
+  position = array('i', [-1]) * len(G)
+  walk = []
+  u = next(s for s in G.nodes if in_degrees[s] > 0)
+  while position[u] == -1:
+    position[u] = len(walk)
+    walk.append(u)
+    u = next(p for p in G.rev[u] if in_degrees[p] > 0)
+  cycle = walk[position[u]:]
+  cycle.reverse()
+  return cycle
+#----------------------------------------------------------------------------}}}
+
+def simple_cycles(G): # {{{
+  # Generate every elementary cycle of the directed graph G (no repeated
+  # nodes), each one as a list [a1, ..., ak] as for find_directed_cycle.
+  # This is Johnson's algorithm, O((V+E)(C+1)) for C cycles: loops come first,
+  # then for each strongly connected component in turn the cycles through
+  # one of its nodes s are listed with a blocked-set search, and s is removed
+  # from the component before it is split up again.
+  #
+  # The search keeps an explicit stack, so long cycles don't hit the recursion
+  # limit. Remember that a graph can have exponentially many cycles.
+  if not G.directed:
+    raise ValueError("simple_cycles needs a directed graph")
+  for u in G.nodes:
+    if G.has_edge(u, u):
+      yield [u]
+
+  count, labels = strongly_connected_components(G)
+  components = [ set(c) for c in scc_components(count, labels) if len(c) > 1 ]
+  while components:
+    component = components.pop()
+    sub = dict( (u, [ v for v in G[u] if v != u and v in component ])
+                for u in component )
+    s = component.pop()
+    for cycle in _cycles_through(sub, s):
+      yield cycle
+
+    del sub[s]
+    for u in sub:
+      sub[u] = [ v for v in sub[u] if v != s ]
+    components.extend( c for c in _components(sub) if len(c) > 1 )
+#----------------------------------------------------------------------------}}}
+def _cycles_through(sub, s): # {{{
+  # The cycles through s in the graph sub (a dictionary from each node to its
+  # list of successors). A node stays blocked while no path from it back to s
+  # avoiding the current path has been found; B[v] holds the nodes to unblock
+  # once v is unblocked.
+  path = [s]
+  blocked = set([s])
+  B = defaultdict(set)
+  closed = set()        # the nodes on the path that reached s
+  stack = [ (s, list(sub[s])) ]
+  while stack:
+    u, neighbors = stack[-1]
+    if neighbors:
+      v = neighbors.pop()
+      if v == s:
+        yield path[:]
+        closed.update(path)
+      elif v not in blocked:
+        path.append(v)
+        stack.append( (v, list(sub[v])) )
+        closed.discard(v)
+        blocked.add(v)
+        continue
+    if not neighbors:
+      if u in closed:
+        _unblock(u, blocked, B)
+      else:
+        for v in sub[u]:
+          B[v].add(u)
+      stack.pop()
+      path.pop()
+#----------------------------------------------------------------------------}}}
+def _unblock(u, blocked, B): # {{{
+  stack = [u]
+  while stack:
+    v = stack.pop()
+    if v in blocked:
+      blocked.remove(v)
+      stack.extend(B[v])
+      B[v].clear()
+#----------------------------------------------------------------------------}}}
+
+def _components(succ): # {{{
+  # The strongly connected components of the graph succ (a dictionary from
+  # each node to its list of successors), as a list of sets.
+  nodes = list(succ)
+  number = dict( (u, i) for (i, u) in enumerate(nodes) )
+  count, labels = tarjan(len(nodes),
+                         lambda i: [ number[v] for v in succ[nodes[i]] ])
+  ret = [ set() for _ in range(count) ]
+  for (i, c) in enumerate(labels):
+    ret[c].add(nodes[i])
+  return ret
+#----------------------------------------------------------------------------}}}
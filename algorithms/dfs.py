@@ -0,0 +1,118 @@
+# imports {{{1
+from __future__ import division
+from array import array
+#---------------------------------------------------------------------------}}}1
+
+# The events generated by dfs
+PRE = "pre"           # (PRE, u, parent): u is discovered
+POST = "post"         # (POST, u, parent): all of u's descendants are done
+TREE = "tree"         # (TREE, u, v): v is discovered from u
+BACK = "back"         # (BACK, u, v): v is an ancestor of u (or v == u)
+FORWARD = "forward"   # (FORWARD, u, v): v is a finished descendant of u
+CROSS = "cross"       # (CROSS, u, v): v is finished and not a descendant of u
+
+def dfs(G, sources = None, edges = True): # {{{
+  # Depth first search of G from each node of sources in turn (every node of
+  # G by default), skipping the nodes already seen. Generates the events
+  # above, in the order a recursive DFS would meet them; the parent of a root
+  # is -1. With edges=False only the PRE and POST events are generated.
+  #
+  # The search keeps an explicit stack of (node, iterator over its
+  # neighbors), so its depth is not limited by the recursion limit, and it
+  # takes O(V+E) time with one byte of state per node (plus the discovery
+  # order, for directed graphs).
+  #
+  # In an undirected graph every edge is met from both ends. The tree edge
+  # back to the parent is skipped, and an edge to an already finished node is
+  # the second sighting of a back edge, so only TREE and BACK edges are
+  # generated.
+  n = len(G)
+  directed = G.directed
+  state = bytearray(n)    # 0 unseen, 1 on the stack, 2 finished
+  if directed:
+    order = array('i', [0]) * n
+  count = 0
+  if sources is None:
+    sources = range(n)
+
+  for s in sources:
+    if state[s]:
+      continue
+    state[s] = 1
+    if directed:
+      order[s] = count
+    count += 1
+    yield PRE, s, -1
+    nodes = [s]
+    parents = [-1]
+    skip = [-1]
+    neighbors = [iter(G[s])]
+    while nodes:
+      u = nodes[-1]
+      for v in neighbors[-1]:
+        if state[v] == 0:
+          break
+        if not edges:
+          continue
+        if state[v] == 1:
+          if not directed and v == skip[-1]:
+            skip[-1] = -1         # skip the tree edge only once
+            continue
+          yield BACK, u, v
+        elif directed:
+          yield (FORWARD if order[u] < order[v] else CROSS), u, v
+      else:
+        # all neighbors of u are done
+        state[u] = 2
+        nodes.pop()
+        neighbors.pop()
+        skip.pop()
+        yield POST, u, parents.pop()
+        continue
+
+      if edges:
+        yield TREE, u, v
+      state[v] = 1
+      if directed:
+        order[v] = count
+      count += 1
+      yield PRE, v, u
+      nodes.append(v)
+      parents.append(u)
+      skip.append(u)
+      neighbors.append(iter(G[v]))
+#----------------------------------------------------------------------------}}}
+
+def find_cycle(G): # {{{
+  # Return the nodes of a cycle in G, in order, or None if G has no cycles. A
+  # loop u -- u is the cycle [u]. In an undirected graph u -- v -- u is not a
+  # cycle, since it takes the same edge back.
+  parent = array('i', [-1]) * len(G)
+  for (event, u, v) in dfs(G):
+    if event is TREE:
+      parent[v] = u
+    elif event is BACK:
+      # v is an ancestor of u: the cycle is the tree path v -> u plus u -> v
+      cycle = [u]
+      while u != v:
+        u = parent[u]
+        cycle.append(u)
+      cycle.reverse()
+      return cycle
+  return None
+#----------------------------------------------------------------------------}}}
+def topological_sort(G): # {{{
+  # Return the nodes of the directed graph G in a topological order, or None
+  # if G has a cycle. This is the reverse of the DFS post-order.
+  post = []
+  for (event, u, _) in dfs(G):
+    if event is POST:
+      post.append(u)
+    elif event is BACK:
+      return None
+  post.reverse()
+  return post
+#----------------------------------------------------------------------------}}}
+def is_DAG(G): # {{{
+  return topological_sort(G) is not None
+#----------------------------------------------------------------------------}}}
@@ -0,0 +1,214 @@
+# imports {{{1
+from __future__ import division
+from array import array
+from random import Random
+
+from algorithms.graph import CSRGraph
+
+try:
+  import numpy as np
+except ImportError:   # only the vectorized generators below need numpy
+  np = None
+#---------------------------------------------------------------------------}}}1
+
+PHI = (1 + 5**0.5)/2
+
+def random_dag(num_nodes, num_edges = None, seed = None): # {{{
+  # A random DAG on num_nodes nodes, as a directed CSRGraph, from num_edges
+  # random edge draws (phi*num_nodes by default, like the homework graphs;
+  # repeated edges are dropped). The same seed gives the same graph.
+  #
+  # Nothing is rejected: the nodes are put in a random order, and every edge
+  # is drawn as a random pair of positions and pointed forward in that order,
+  # so the graph is acyclic by construction. O(V + E log E) for the sort of
+  # the distinct edge keys, which runs in C and beats an O(V+E) counting sort
+  # written in Python on graphs of 10^6 nodes.
+  rng = Random(seed)
+  if num_edges is None:
+    num_edges = int(num_nodes*PHI)
+  order = _random_order(num_nodes, rng)
+  return CSRGraph.from_keys(num_nodes,
+                            sorted(_forward_keys(order, num_edges, rng)),
+                            directed = True)
+#----------------------------------------------------------------------------}}}
+def random_dag_with_hamiltonian_path(num_nodes, num_edges = None, seed = None): # {{{
+  # A random DAG with a Hamiltonian path, as for random_dag: the edges
+  # between consecutive nodes of the random order form the path, and the
+  # rest of the num_edges draws are random forward edges.
+  rng = Random(seed)
+  if num_edges is None:
+    num_edges = int(num_nodes*PHI)
+  n = num_nodes
+  order = _random_order(n, rng)
+  keys = _forward_keys(order, num_edges - (n - 1), rng)
+  keys.update( order[i-1]*n + order[i] for i in range(1, n) )
+  return CSRGraph.from_keys(n, sorted(keys), directed = True)
+#----------------------------------------------------------------------------}}}
+
+def _random_order(n, rng): # {{{
+  # a uniformly random permutation of range(n) (rng.shuffle is Fisher-Yates)
+  order = list(range(n))
+  rng.shuffle(order)
+  return order
+#----------------------------------------------------------------------------}}}
+def _forward_keys(order, num_edges, rng): # {{{
+  # The set of keys s*n + t of num_edges random draws of an edge (s,t) with s
+  # before t in order. Draws of a loop are skipped.
+  n = len(order)
+  keys = set()
+  if n < 2:
+    return keys
+  for _ in range(num_edges):
+    i = rng.randrange(n)
+    j = rng.randrange(n)
+    if i < j:
+      keys.add(order[i]*n + order[j])
+    elif j < i:
+      keys.add(order[j]*n + order[i])
+  return keys
+#----------------------------------------------------------------------------}}}
+
+# Vectorized generators. These need numpy: every edge, weight and backbone
+# edge is drawn in one batch, the edges are deduplicated by sorting their keys
+# s*n + t, and the CSR arrays are handed straight to CSRGraph.from_arrays.
+#
+# weights is None for an unweighted graph, or a pair (low, high) for integer
+# weights drawn uniformly from low..high (both ends included); an undirected
+# edge gets the same weight in both directions. connected=True adds a random
+# spanning tree as a backbone, so the graph is connected (weakly connected, if
+# directed) without retrying.
+
+def erdos_renyi(num_nodes, num_edges = None, directed = False, seed = None,
+                weights = None, connected = False): # {{{
+  # Random graph from num_edges uniform draws of an edge (phi*num_nodes by
+  # default, like the homework graphs). Repeated edges and loops are dropped,
+  # so this is the G(n,m) model up to the few collisions of a sparse graph.
+  rng = _rng(seed)
+  n = num_nodes
+  if num_edges is None:
+    num_edges = int(n*PHI)
+  src = rng.integers(0, max(n, 1), num_edges)
+  dst = rng.integers(0, max(n, 1), num_edges)
+  return _graph(n, src, dst, directed, rng, weights, connected)
+#----------------------------------------------------------------------------}}}
+def barabasi_albert(num_nodes, m = 2, seed = None, weights = None,
+                    connected = False): # {{{
+  # Preferential attachment: node v arrives with m edges whose other ends are
+  # picked with probability proportional to degree. This is the
+  # Batagelj-Brandes edge-copying scheme, vectorized: the endpoints of edge k
+  # are slots 2k (the new node k//m) and 2k+1, and slot 2k+1 copies slot r for
+  # a uniform r in 0..2k. A copy of an odd slot is resolved by following the
+  # copies back, all edges at once, until it lands on an even slot.
+  rng = _rng(seed)
+  num_edges = num_nodes*m
+  k = np.arange(num_edges)
+  copies = (rng.random(num_edges) * (2*k + 1)).astype(np.int64)
+  slot = copies.copy()
+  odd = np.flatnonzero(slot & 1)
+  while len(odd):
+    slot[odd] = copies[slot[odd] >> 1]
+    odd = odd[ (slot[odd] & 1) == 1 ]
+  src = k // m
+  dst = (slot >> 1) // m
+  return _graph(num_nodes, src, dst, False, rng, weights, connected)
+#----------------------------------------------------------------------------}}}
+def random_geometric(num_nodes, radius, seed = None, weights = None,
+                     connected = False): # {{{
+  # num_nodes uniform points in the unit square, with an edge between any two
+  # points at distance at most radius. The points are bucketed into a grid of
+  # cells of side radius, so only the pairs in the same or adjacent cells are
+  # compared. The points are returned as well: (G, x, y).
+  rng = _rng(seed)
+  n = num_nodes
+  x = rng.random(n)
+  y = rng.random(n)
+  side = max(int(1 / radius), 1)
+  cx = np.minimum((x * side).astype(np.int64), side - 1)
+  cy = np.minimum((y * side).astype(np.int64), side - 1)
+  cell = cx*side + cy
+  by_cell = np.argsort(cell, kind="stable")
+  starts = np.searchsorted(cell[by_cell], np.arange(side*side + 1))
+
+  sources, targets = [], []
+  # the cell itself and half of its neighbors, so each pair is seen once
+  for (dx, dy) in ( (0, 0), (1, -1), (1, 0), (1, 1), (0, 1) ):
+    nx, ny = cx + dx, cy + dy
+    ok = (nx < side) & (ny >= 0) & (ny < side)
+    points = np.flatnonzero(ok)
+    other = nx[points]*side + ny[points]
+    lengths = starts[other + 1] - starts[other]
+    src = np.repeat(points, lengths)
+    first = np.repeat(starts[other], lengths)
+    within = np.arange(len(src)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    dst = by_cell[first + within]
+    keep = (x[src] - x[dst])**2 + (y[src] - y[dst])**2 <= radius**2
+    if (dx, dy) == (0, 0):
+      keep &= src < dst
+    sources.append(src[keep])
+    targets.append(dst[keep])
+  G = _graph(n, np.concatenate(sources), np.concatenate(targets), False,
+             rng, weights, connected)
+  return G, x, y
+#----------------------------------------------------------------------------}}}
+def grid(rows, cols, seed = None, weights = None): # {{{
+  # The rows x cols grid graph, with node r*cols + c at row r and column c
+  # joined to its right and lower neighbors. It is connected already.
+  rng = _rng(seed)
+  node = np.arange(rows*cols).reshape(rows, cols)
+  src = np.concatenate( (node[:, :-1].ravel(), node[:-1, :].ravel()) )
+  dst = np.concatenate( (node[:, 1:].ravel(), node[1:, :].ravel()) )
+  return _graph(rows*cols, src, dst, False, rng, weights, False)
+#----------------------------------------------------------------------------}}}
+
+def _rng(seed): # {{{
+  if np is None:
+    raise ImportError("the vectorized graph generators need numpy")
+  return np.random.default_rng(seed)
+#----------------------------------------------------------------------------}}}
+def _graph(n, src, dst, directed, rng, weights, connected): # {{{
+  # The CSRGraph with the edges src[i] -> dst[i], after adding the backbone
+  # and the weights, dropping loops and keeping the smallest weight of any
+  # repeated edge.
+  src = np.asarray(src, dtype=np.int64)
+  dst = np.asarray(dst, dtype=np.int64)
+  if connected and n > 1:
+    # a random recursive tree: the i-th node of a random order hangs from one
+    # of the nodes before it
+    order = rng.permutation(n)
+    i = np.arange(1, n)
+    parent = order[ (rng.random(n - 1) * i).astype(np.int64) ]
+    src = np.concatenate( (src, parent) )
+    dst = np.concatenate( (dst, order[1:]) )
+  loops = src == dst
+  src, dst = src[~loops], dst[~loops]
+
+  wts = None
+  if weights is not None:
+    low, high = weights
+    wts = rng.integers(low, high + 1, len(src)).astype(np.float64)
+  if not directed:
+    src, dst = np.concatenate( (src, dst) ), np.concatenate( (dst, src) )
+    if wts is not None:
+      wts = np.concatenate( (wts, wts) )
+
+  keys = src*n + dst
+  if wts is None:
+    keys = np.unique(keys)
+  else:
+    by_key = np.lexsort( (wts, keys) )
+    keys, wts = keys[by_key], wts[by_key]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    keys, wts = keys[first], wts[first]
+
+  offsets = np.zeros(n + 1, dtype=np.int64)
+  np.cumsum(np.bincount(keys // n, minlength=n), out=offsets[1:])
+  return CSRGraph.from_arrays(_array('i', offsets), _array('i', keys % n),
+                              None if wts is None else _array('d', wts),
+                              directed)
+#----------------------------------------------------------------------------}}}
+def _array(typecode, a): # {{{
+  # copy a numpy array into an array.array of the given type
+  dtype = np.intc if typecode == 'i' else np.float64
+  return array(typecode, np.ascontiguousarray(a, dtype=dtype).tobytes())
+#----------------------------------------------------------------------------}}}
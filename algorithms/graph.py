@@ -0,0 +1,465 @@
+# imports {{{1
+from __future__ import division
+from array import array
+from bisect import bisect_left
+from copy import deepcopy
+#---------------------------------------------------------------------------}}}1
+
+class AdjList: # {{{1
+  # A class for the adjacency list representation of a graph.
+  # Undirected graphs will have an edge (s,t) if and only if it has edge (t,s).
+  # A directed graph might have edge (s,t) without having edge (t,s).
+
+  # AdjList.adj is the actual adjacency list.
+  # AdjList.rev is the adjacency list of the reverse graph
+  # AdjList.directed is a bool indicating whether the graph is directed.
+  # AdjList.nodes is an array of the form range(n).
+
+  # Edges may be specified on initialization or with the add_edge method.
+  # Next to every adjacency list is a hash from neighbor to its position in
+  # the list, so add_edge, del_edge and has_edge are O(1). del_edge moves the
+  # last neighbor into the hole, so the lists are only sorted again after
+  # AdjList.sort(). Once the graph is built, AdjList.freeze() returns an
+  # immutable CSRGraph for the read-heavy algorithms.
+
+  # If A is an AdjList, then...
+  #   - A[i] is the adjacency list for node i
+  #   - len(A) is the number of nodes in the graph, *not* the number of edges
+  #   - str(A) is a "nicer" version of the adjacency list. It gets run when you
+  #     explicity or implicityly convert A to a string (like with print).
+  # These correspond to the last 3 class methods.
+
+  def __init__(self, num_nodes, edges = [], directed = False): # {{{
+    self.nodes = range(num_nodes)
+    self.adj = [ [] for _ in self.nodes ]
+    self.rev = [ [] for _ in self.nodes ]
+    self._adj_pos = [ {} for _ in self.nodes ]
+    self._rev_pos = [ {} for _ in self.nodes ]
+    self.directed = directed
+
+    for (s,t) in edges:
+      self.add_edge(s,t)
+
+    self.sort()
+  #--------------------------------------------------------------------------}}}
+
+  def add_edge(self, s, t, try_directed = True): # {{{
+  # Adds an edge (s,t). If the graph is undirected, it adds edge (t,s) as well.
+    if t not in self._adj_pos[s]:
+      self._adj_pos[s][t] = len(self.adj[s])
+      self.adj[s].append(t)
+      self._rev_pos[t][s] = len(self.rev[t])
+      self.rev[t].append(s)
+
+    if not self.directed and try_directed:
+      self.add_edge(t, s, try_directed = False)
+  #--------------------------------------------------------------------------}}}
+  def del_edge(self, s, t, try_directed = True): # {{{
+  # Deletes an edge (s,t) if it exists. If the graph is undirected, it deletes
+  # the edge (t,s) as well.
+    if t in self._adj_pos[s]:
+      _swap_remove(self.adj[s], self._adj_pos[s], t)
+      _swap_remove(self.rev[t], self._rev_pos[t], s)
+
+    if not self.directed and try_directed:
+      self.del_edge(t, s, try_directed = False)
+  #--------------------------------------------------------------------------}}}
+
+  def has_edge(self, s, t): # {{{
+    return t in self._adj_pos[s]
+  #--------------------------------------------------------------------------}}}
+  def has_edge_rev(self, s, t): # {{{
+    return t in self._rev_pos[s]
+  #--------------------------------------------------------------------------}}}
+  def is_path(self, path): # {{{
+    if not path:    # if path is [] or None
+      return False
+
+    for i in range(1, len(path)):
+      if not self.has_edge(path[i-1], path[i]):
+        return False
+    return True
+  #--------------------------------------------------------------------------}}}
+  def is_cycle(self, path): # {{{
+    # in an undirected graph 1-cycles don't count
+    if not self.directed and len(path) == 2:
+      return False
+
+    return self.is_path(list(path) + [path[0]])
+  #--------------------------------------------------------------------------}}}
+
+  def in_degree(self, s): # {{{
+    return len(self.rev[s])
+  #--------------------------------------------------------------------------}}}
+  def out_degree(self, s): # {{{
+    return len(self.adj[s])
+  #--------------------------------------------------------------------------}}}
+  def degree(self, s): # {{{
+    if not self.directed:
+      return self.out_degree(s)
+
+    return self.out_degree(s) + self.in_degree(s)
+  #--------------------------------------------------------------------------}}}
+  def in_degrees(self): # {{{
+    # The in-degree of every node as an array('i'), in O(V).
+    return array('i', map(len, self.rev))
+  #--------------------------------------------------------------------------}}}
+  def out_degrees(self): # {{{
+    # The out-degree of every node as an array('i'), in O(V).
+    return array('i', map(len, self.adj))
+  #--------------------------------------------------------------------------}}}
+  def degrees(self): # {{{
+    # The degree of every node as an array('i'), in O(V).
+    if not self.directed:
+      return self.out_degrees()
+
+    return array('i', [ len(a) + len(r) for (a,r) in zip(self.adj, self.rev) ])
+  #--------------------------------------------------------------------------}}}
+
+  def sort(self): # {{{
+    # Sort the adjacency lists
+    for n in self.nodes:
+      self.adj[n] = sorted(self.adj[n])
+      self.rev[n] = sorted(self.rev[n])
+      self._adj_pos[n] = dict( (t,i) for (i,t) in enumerate(self.adj[n]) )
+      self._rev_pos[n] = dict( (s,i) for (i,s) in enumerate(self.rev[n]) )
+  #--------------------------------------------------------------------------}}}
+  def reverse(self): # {{{
+    # returns reverse graph
+    rev_adjlist = AdjList(len(self.nodes), directed = self.directed)
+    rev_adjlist.adj = deepcopy(self.rev)
+    rev_adjlist.rev = deepcopy(self.adj)
+    rev_adjlist._adj_pos = deepcopy(self._rev_pos)
+    rev_adjlist._rev_pos = deepcopy(self._adj_pos)
+
+    return rev_adjlist
+  #--------------------------------------------------------------------------}}}
+  def freeze(self, w = None): # {{{
+    # Return an immutable CSRGraph with the same edges and sorted rows. If a
+    # weight dictionary w (keyed by the edge (s,t)) is given, the weights are
+    # stored next to the neighbors in the CSRGraph. O(V + E log(max degree)).
+    offsets = array('i', [0]*(len(self.nodes)+1))
+    targets = array('i')
+    weights = None if w is None else array('d')
+    for s in self.nodes:
+      row = sorted(self.adj[s])
+      targets.extend(row)
+      if w is not None:
+        weights.extend( w[(s,t)] for t in row )
+      offsets[s+1] = len(targets)
+    return CSRGraph.from_arrays(offsets, targets, weights, directed = self.directed)
+  #--------------------------------------------------------------------------}}}
+
+  def __getitem__(self, node):  # {{{
+    return self.adj[node]
+  #--------------------------------------------------------------------------}}}
+  def __len__(self):  # {{{
+    return len(self.nodes)
+  #--------------------------------------------------------------------------}}}
+  def __str__(self):  # {{{
+    ret = ""
+    for n in self.nodes:
+      neighbors = [ str(i) for i in self.adj[n] ]
+      ret += str(n) + ": " + " ".join(neighbors) + "\n"
+    return ret[:-1]
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
+
+def _swap_remove(row, pos, x): # {{{
+  # Remove x from the list row in O(1), where pos maps each entry of row to its
+  # index. The last entry is moved into the position x held.
+  i = pos.pop(x)
+  last = row.pop()
+  if last != x:
+    row[i] = last
+    pos[last] = i
+#----------------------------------------------------------------------------}}}
+
+class _Rows(object): # {{{1
+  # A read-only view of the rows of a CSR pair (offsets, targets), so that
+  # G.adj[u] and G.rev[u] work for a CSRGraph the same way they do for an
+  # AdjList. Row u is targets[offsets[u]:offsets[u+1]].
+
+  def __init__(self, offsets, targets): # {{{
+    self.offsets = offsets
+    self.targets = targets
+  #--------------------------------------------------------------------------}}}
+
+  def __getitem__(self, node):  # {{{
+    return self.targets[self.offsets[node]:self.offsets[node+1]]
+  #--------------------------------------------------------------------------}}}
+  def __len__(self):  # {{{
+    return len(self.offsets) - 1
+  #--------------------------------------------------------------------------}}}
+  def __iter__(self):  # {{{
+    for n in range(len(self)):
+      yield self[n]
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
+
+class CSRGraph(object): # {{{1
+  # An immutable compressed sparse row (CSR) representation of a graph. It has
+  # the same read-only interface as AdjList (G[u], len(G), G.nodes, G.adj,
+  # G.rev, has_edge, in_degree, out_degree, ...), so the algorithms written
+  # against AdjList run on it unchanged.
+  #
+  # CSRGraph.offsets -- array('i') of length n+1. The neighbors of node u are
+  #   CSRGraph.targets[offsets[u]:offsets[u+1]], in sorted order.
+  # CSRGraph.targets -- array('i') holding every adjacency list back to back.
+  # CSRGraph.weights -- None, or an array('d') parallel to targets, so that the
+  #   weight of the edge (u, targets[i]) is weights[i].
+  # CSRGraph.rev_offsets, CSRGraph.rev_targets -- the same for the reverse
+  #   graph. rev_weights is parallel to rev_targets.
+  #
+  # The graph is built in bulk from an edge list in O(E log E): the edges are
+  # encoded as single integers s*n + t, sorted and deduplicated, and the
+  # offsets come from counting. Four bytes per edge endpoint are used instead
+  # of a python int in a python list. If an edge is listed twice with
+  # different weights, the smaller weight is kept.
+
+  def __init__(self, num_nodes, edges = [], directed = False, weights = None): # {{{
+    # edges is an iterable of pairs (s,t). weights, if given, is an iterable of
+    # numbers parallel to edges.
+    n = num_nodes
+    if weights is None:
+      keys = set()
+      for (s,t) in edges:
+        keys.add(s*n + t)
+        if not directed:
+          keys.add(t*n + s)
+      keys = sorted(keys)
+      wts = None
+    else:
+      pairs = []
+      for ((s,t), wt) in zip(edges, weights):
+        pairs.append( (s*n + t, wt) )
+        if not directed and s != t:
+          pairs.append( (t*n + s, wt) )
+      pairs.sort()
+      keys = []
+      wts = array('d')
+      for (key, wt) in pairs:
+        if not keys or keys[-1] != key:   # sorted, so the first has least weight
+          keys.append(key)
+          wts.append(wt)
+
+    offsets, targets = _key_arrays(n, keys)
+    self._set_arrays(n, offsets, targets, wts, directed)
+  #--------------------------------------------------------------------------}}}
+
+  @classmethod
+  def from_arrays(cls, offsets, targets, weights = None, directed = False): # {{{
+    # Build a CSRGraph directly from CSR arrays, without copying them. Every
+    # row of targets must already be sorted and free of duplicates.
+    G = cls.__new__(cls)
+    G._set_arrays(len(offsets) - 1, offsets, targets, weights, directed)
+    return G
+  #--------------------------------------------------------------------------}}}
+
+  @classmethod
+  def from_keys(cls, num_nodes, keys, weights = None, directed = False): # {{{
+    # Build a CSRGraph from the sorted list of distinct edge keys s*n + t (in
+    # both directions for an undirected graph), for generators that produce
+    # the keys directly instead of a list of pairs.
+    offsets, targets = _key_arrays(num_nodes, keys)
+    return cls.from_arrays(offsets, targets, weights, directed)
+  #--------------------------------------------------------------------------}}}
+
+  def _set_arrays(self, num_nodes, offsets, targets, weights, directed): # {{{
+    self.nodes = range(num_nodes)
+    self.directed = directed
+    self.offsets = offsets
+    self.targets = targets
+    self.weights = weights
+
+    # The reverse graph is a counting sort of the forward arrays. Since the
+    # sources are visited in increasing order, every reverse row comes out
+    # sorted as well.
+    if directed:
+      rev_offsets = array('i', [0]*(num_nodes+1))
+      for t in targets:
+        rev_offsets[t+1] += 1
+      for u in range(num_nodes):
+        rev_offsets[u+1] += rev_offsets[u]
+      rev_targets = array('i', [0]*len(targets))
+      rev_weights = None if weights is None else array('d', [0]*len(targets))
+      fill = array('i', rev_offsets[:-1])
+      for s in range(num_nodes):
+        for i in range(offsets[s], offsets[s+1]):
+          t = targets[i]
+          rev_targets[fill[t]] = s
+          if weights is not None:
+            rev_weights[fill[t]] = weights[i]
+          fill[t] += 1
+    else:
+      rev_offsets, rev_targets, rev_weights = offsets, targets, weights
+    self.rev_offsets = rev_offsets
+    self.rev_targets = rev_targets
+    self.rev_weights = rev_weights
+
+    self.adj = _Rows(self.offsets, self.targets)
+    self.rev = _Rows(self.rev_offsets, self.rev_targets)
+  #--------------------------------------------------------------------------}}}
+
+  def with_weights(self, w): # {{{
+    # Return a CSRGraph with the same (shared) structure and the weights from
+    # the dictionary w, keyed by the edge (s,t), stored next to the neighbors.
+    weights = array('d', [0]*len(self.targets))
+    for s in self.nodes:
+      for i in range(self.offsets[s], self.offsets[s+1]):
+        weights[i] = w[(s, self.targets[i])]
+    return CSRGraph.from_arrays(self.offsets, self.targets, weights, self.directed)
+  #--------------------------------------------------------------------------}}}
+
+  def num_edges(self): # {{{
+    # Number of edges. An undirected edge s -- t with s != t is counted once.
+    if self.directed:
+      return len(self.targets)
+    loops = sum( 1 for u in self.nodes if self.has_edge(u,u) )
+    return (len(self.targets) + loops) // 2
+  #--------------------------------------------------------------------------}}}
+  def edges(self): # {{{
+    # Generate the edges (s,t). For undirected graphs only s <= t is produced.
+    for s in self.nodes:
+      for i in range(self.offsets[s], self.offsets[s+1]):
+        t = self.targets[i]
+        if self.directed or s <= t:
+          yield (s,t)
+  #--------------------------------------------------------------------------}}}
+
+  def _find(self, s, t): # {{{
+    # index of the edge (s,t) in targets, or -1 if there is no such edge
+    lo, hi = self.offsets[s], self.offsets[s+1]
+    i = bisect_left(self.targets, t, lo, hi)
+    if i < hi and self.targets[i] == t:
+      return i
+    return -1
+  #--------------------------------------------------------------------------}}}
+  def has_edge(self, s, t): # {{{
+    return self._find(s,t) != -1
+  #--------------------------------------------------------------------------}}}
+  def has_edge_rev(self, s, t): # {{{
+    lo, hi = self.rev_offsets[s], self.rev_offsets[s+1]
+    i = bisect_left(self.rev_targets, t, lo, hi)
+    return i < hi and self.rev_targets[i] == t
+  #--------------------------------------------------------------------------}}}
+  def weight(self, s, t): # {{{
+    # Weight of the edge (s,t). Raises KeyError if there is no such edge.
+    i = self._find(s,t)
+    if i == -1 or self.weights is None:
+      raise KeyError((s,t))
+    return self.weights[i]
+  #--------------------------------------------------------------------------}}}
+  def weighted(self, s): # {{{
+    # The pairs (t, weight of (s,t)) for the neighbors t of s
+    lo, hi = self.offsets[s], self.offsets[s+1]
+    return zip(self.targets[lo:hi], self.weights[lo:hi])
+  #--------------------------------------------------------------------------}}}
+  def is_path(self, path): # {{{
+    if not path:    # if path is [] or None
+      return False
+
+    for i in range(1, len(path)):
+      if not self.has_edge(path[i-1], path[i]):
+        return False
+    return True
+  #--------------------------------------------------------------------------}}}
+  def is_cycle(self, path): # {{{
+    # in an undirected graph 1-cycles don't count
+    if not self.directed and len(path) == 2:
+      return False
+
+    return self.is_path(list(path) + [path[0]])
+  #--------------------------------------------------------------------------}}}
+
+  def in_degree(self, s): # {{{
+    return self.rev_offsets[s+1] - self.rev_offsets[s]
+  #--------------------------------------------------------------------------}}}
+  def out_degree(self, s): # {{{
+    return self.offsets[s+1] - self.offsets[s]
+  #--------------------------------------------------------------------------}}}
+  def degree(self, s): # {{{
+    if not self.directed:
+      return self.out_degree(s)
+
+    return self.out_degree(s) + self.in_degree(s)
+  #--------------------------------------------------------------------------}}}
+  def in_degrees(self): # {{{
+    # The in-degree of every node as an array('i'), in O(V).
+    off = self.rev_offsets
+    return array('i', [ off[u+1] - off[u] for u in self.nodes ])
+  #--------------------------------------------------------------------------}}}
+  def out_degrees(self): # {{{
+    # The out-degree of every node as an array('i'), in O(V).
+    off = self.offsets
+    return array('i', [ off[u+1] - off[u] for u in self.nodes ])
+  #--------------------------------------------------------------------------}}}
+  def degrees(self): # {{{
+    # The degree of every node as an array('i'), in O(V).
+    if not self.directed:
+      return self.out_degrees()
+
+    off, rev_off = self.offsets, self.rev_offsets
+    return array('i', [ off[u+1] - off[u] + rev_off[u+1] - rev_off[u]
+                        for u in self.nodes ])
+  #--------------------------------------------------------------------------}}}
+
+  def sort(self): # {{{
+    # The rows of a CSRGraph are always sorted. This is here so that code
+    # written for AdjList can call it.
+    pass
+  #--------------------------------------------------------------------------}}}
+  def reverse(self): # {{{
+    # returns reverse graph. The arrays are never modified, so they are shared
+    # rather than copied.
+    R = CSRGraph.__new__(CSRGraph)
+    R.nodes = self.nodes
+    R.directed = self.directed
+    R.offsets, R.rev_offsets = self.rev_offsets, self.offsets
+    R.targets, R.rev_targets = self.rev_targets, self.targets
+    R.weights, R.rev_weights = self.rev_weights, self.weights
+    R.adj = _Rows(R.offsets, R.targets)
+    R.rev = _Rows(R.rev_offsets, R.rev_targets)
+    return R
+  #--------------------------------------------------------------------------}}}
+
+  def __getitem__(self, node):  # {{{
+    return self.targets[self.offsets[node]:self.offsets[node+1]]
+  #--------------------------------------------------------------------------}}}
+  def __len__(self):  # {{{
+    return len(self.nodes)
+  #--------------------------------------------------------------------------}}}
+  def __str__(self):  # {{{
+    ret = ""
+    for n in self.nodes:
+      neighbors = [ str(i) for i in self[n] ]
+      ret += str(n) + ": " + " ".join(neighbors) + "\n"
+    return ret[:-1]
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
+
+def _key_arrays(n, keys): # {{{
+  # offsets and targets of the CSR arrays for the sorted edge keys s*n + t
+  offsets = array('i', [0]*(n+1))
+  targets = array('i', [0]*len(keys))
+  for (i, key) in enumerate(keys):
+    offsets[key // n + 1] += 1
+    targets[i] = key % n
+  for u in range(n):
+    offsets[u+1] += offsets[u]
+  return offsets, targets
+#----------------------------------------------------------------------------}}}
+
+def weighted_graph(G, w = None): # {{{
+  # Return G as a CSRGraph with weights stored next to the neighbors. G is an
+  # AdjList or CSRGraph, and w is a dictionary of edge weights keyed by (s,t).
+  # If w is None, G must already be a weighted CSRGraph and is returned as it
+  # is; otherwise the weights of w are copied in, in O(V+E).
+  if w is None:
+    if getattr(G, "weights", None) is None:
+      raise ValueError("G has no weights and no weight dictionary was given")
+    return G
+  if isinstance(G, CSRGraph):
+    return G.with_weights(w)
+  return G.freeze(w)
+#----------------------------------------------------------------------------}}}
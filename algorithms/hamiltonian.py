@@ -0,0 +1,79 @@
+# imports {{{1
+from __future__ import division
+
+from algorithms.dfs import topological_sort
+#---------------------------------------------------------------------------}}}1
+
+def hamiltonian_path_dag(G): # {{{
+  # Return a Hamiltonian path of the DAG G (a list of all its nodes, each one
+  # joined to the next by an edge), or None if there is none. O(V+E).
+  #
+  # A Hamiltonian path of a DAG visits the nodes in a topological order, and
+  # that order is then the only one. So G has a Hamiltonian path exactly
+  # when consecutive nodes of any topological order are joined by edges.
+  order = topological_sort(G)
+  if order is None:
+    raise ValueError("hamiltonian_path_dag needs a directed acyclic graph")
+  for i in range(1, len(order)):
+    if not G.has_edge(order[i-1], order[i]):
+      return None
+  return order
+#----------------------------------------------------------------------------}}}
+def hamiltonian_path(G, max_nodes = 20): # {{{
+  # Return a Hamiltonian path of any graph G, or None if there is none. DAGs
+  # use hamiltonian_path_dag; other graphs use the Held-Karp dynamic program
+  # over subsets, O(2^V V^2) time and O(2^V) memory, so it refuses graphs with
+  # more than max_nodes nodes.
+  if G.directed and topological_sort(G) is not None:
+    return hamiltonian_path_dag(G)
+  n = len(G)
+  if n > max_nodes:
+    raise ValueError("Held-Karp on %d nodes needs 2^%d subsets" % (n, n))
+  if n == 0:
+    return []
+
+  # succ[v] and pred[v] are bitmasks of the neighbors of v. ends[S] is the
+  # bitmask of the nodes v such that some path visits exactly the nodes of S
+  # and ends at v.
+  succ = [ 0 for _ in G.nodes ]
+  pred = [ 0 for _ in G.nodes ]
+  for u in G.nodes:
+    for v in G[u]:
+      if u != v:
+        succ[u] |= 1 << v
+        pred[v] |= 1 << u
+  full = (1 << n) - 1
+  ends = [ 0 ] * (full + 1)
+  for v in G.nodes:
+    ends[1 << v] = 1 << v
+
+  for S in range(1, full):
+    E = ends[S]
+    if not E:
+      continue
+    # the nodes outside S that a path over S can be extended to
+    extend = 0
+    while E:
+      bit = E & -E
+      extend |= succ[bit.bit_length() - 1]
+      E ^= bit
+    extend &= ~S
+    while extend:
+      bit = extend & -extend
+      ends[S | bit] |= bit
+      extend ^= bit
+
+  if not ends[full]:
+    return None
+  # walk back from any end of a full path
+  S = full
+  v = (ends[full] & -ends[full]).bit_length() - 1
+  path = [v]
+  while S != 1 << v:
+    S ^= 1 << v
+    candidates = ends[S] & pred[v]
+    v = (candidates & -candidates).bit_length() - 1
+    path.append(v)
+  path.reverse()
+  return path
+#----------------------------------------------------------------------------}}}
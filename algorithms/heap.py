@@ -0,0 +1,578 @@
+# imports {{{1
+from __future__ import division
+#---------------------------------------------------------------------------}}}1
+
+class Heap: # {{{1
+  # A d-ary min-heap (binary by default). A node n in the tree is a pair
+  # n = (k,v), where k is the key of n and v is the value. The tree is always
+  # balanced, and is stored in two flat parallel lists, Heap.keys and
+  # Heap.values, so that the node at index i is (Heap.keys[i], Heap.values[i]).
+  #
+  # if Heap.keys = [a, b, c, d, e, f, g, h, i, j, k, l, m, n], then this
+  # corresponds to the binary tree
+  #          ____a____
+  #         /         \
+  #       _b_         _c_
+  #      /   \       /   \
+  #     d     e     f     g
+  #    / \   / \   / \   /
+  #   h   i j   k l   m n
+  #
+  # With Heap.arity = d, the parent of index i is (i-1)//d and its children are
+  # d*i+1, ..., d*i+d. A 4-ary or 8-ary heap is shallower, so add and key
+  # decreases touch fewer levels, and the children sit next to each other in
+  # memory. Both sift operations move a "hole" up or down the tree and write
+  # the moving node once at the end, instead of swapping at every level.
+  #
+  # Heap(initial) builds the heap bottom-up (Floyd's method) in O(n) rather
+  # than by n calls to add.
+  #
+  # If H is a heap, then:
+  #   H.__getitem__(index) is run to return H[index],
+  #   H.__delitem__(index) is run to execute del H[index],
+  #   H.__len__ is run to execute len(H)
+  #   H.__str__ is run to execute str(H), print H, etc.
+
+  def __init__(self, initial = [], arity = 2): # {{{
+    if arity < 2:
+      raise ValueError("heap arity must be at least 2")
+    self.arity = arity
+    initial = list(initial)     # read once, initial may be a generator
+    self.keys = [ k for (k,v) in initial ]
+    self.values = [ v for (k,v) in initial ]
+    for index in range((len(self.keys) - 2)//arity, -1, -1):
+      self._heapify_down(index)
+  #--------------------------------------------------------------------------}}}
+
+  @classmethod
+  def heapify(cls, nodes, arity = 2): # {{{
+    # Build a heap from an iterable of (key, value) pairs in O(n).
+    return cls(initial = nodes, arity = arity)
+  #--------------------------------------------------------------------------}}}
+
+  @property
+  def nodes(self): # {{{
+    # The (key, value) pairs in heap order
+    return list(zip(self.keys, self.values))
+  #--------------------------------------------------------------------------}}}
+
+  def _parent_index(self, index): # {{{
+    # Return the index of the parent of the node at given index. In the example
+    # above, the index of node f is 5, so Heap._parent_index(5) = 2, the index
+    # of the node c.
+    return None if index <= 0 else (index - 1) // self.arity
+  #--------------------------------------------------------------------------}}}
+  def _child_index(self, index, direct):  # {{{
+    return self.arity*index + 1 + direct
+  #--------------------------------------------------------------------------}}}
+
+  def _heapify_up(self, index): # {{{
+    # heapify_up, as discussed in class and the the book.
+    keys, values = self.keys, self.values
+    d = self.arity
+    key, value = keys[index], values[index]
+    while index > 0:
+      parent = (index - 1) // d
+      if not key < keys[parent]:
+        break
+      keys[index] = keys[parent]
+      values[index] = values[parent]
+      index = parent
+    keys[index] = key
+    values[index] = value
+  #--------------------------------------------------------------------------}}}
+  def _heapify_down(self, index): # {{{
+    keys, values = self.keys, self.values
+    d = self.arity
+    size = len(keys)
+    key, value = keys[index], values[index]
+    child = d*index + 1
+    while child < size:
+      # pick the smallest child
+      if d == 2:
+        if child + 1 < size and keys[child+1] < keys[child]:
+          child += 1
+      else:
+        for c in range(child + 1, min(child + d, size)):
+          if keys[c] < keys[child]:
+            child = c
+      if not keys[child] < key:
+        break
+      keys[index] = keys[child]
+      values[index] = values[child]
+      index = child
+      child = d*index + 1
+    keys[index] = key
+    values[index] = value
+  #--------------------------------------------------------------------------}}}
+
+  def add(self, new_node):  # {{{
+    # new_node is a tuple, new_node=(key,value)
+    self.keys.append(new_node[0])
+    self.values.append(new_node[1])
+    self._heapify_up(len(self.keys)-1)
+  #--------------------------------------------------------------------------}}}
+  def peek(self): # {{{
+    # Return the node (key, value) with the least key. Raise IndexError if the
+    # heap is empty.
+    return (self.keys[0], self.values[0])
+  #--------------------------------------------------------------------------}}}
+  def pop(self): # {{{
+    # Remove and return the node (key, value) with the least key. Raise
+    # IndexError if the heap is empty.
+    keys, values = self.keys, self.values
+    last_key, last_value = keys.pop(), values.pop()
+    if not keys:
+      return (last_key, last_value)
+    top = (keys[0], values[0])
+    keys[0], values[0] = last_key, last_value
+    self._heapify_down(0)
+    return top
+  #--------------------------------------------------------------------------}}}
+  def pushpop(self, new_node): # {{{
+    # Add new_node and then pop the least node, in one sift. If new_node is no
+    # bigger than the top, it is returned without touching the heap.
+    keys, values = self.keys, self.values
+    if not keys or not keys[0] < new_node[0]:
+      return new_node
+    top = (keys[0], values[0])
+    keys[0], values[0] = new_node
+    self._heapify_down(0)
+    return top
+  #--------------------------------------------------------------------------}}}
+  def replace(self, new_node): # {{{
+    # Pop the least node and then add new_node, in one sift. Unlike pushpop,
+    # the returned node may be bigger than new_node. Raise IndexError if the
+    # heap is empty.
+    keys, values = self.keys, self.values
+    top = (keys[0], values[0])
+    keys[0], values[0] = new_node
+    self._heapify_down(0)
+    return top
+  #--------------------------------------------------------------------------}}}
+  def remove(self, index):  # {{{
+    keys, values = self.keys, self.values
+    last_key, last_value = keys.pop(), values.pop()
+    if index == len(keys):
+      return
+    keys[index], values[index] = last_key, last_value
+    # the moved node may belong above or below its new position
+    if index > 0 and last_key < keys[(index - 1) // self.arity]:
+      self._heapify_up(index)
+    else:
+      self._heapify_down(index)
+  #--------------------------------------------------------------------------}}}
+
+  def __getitem__(self, index):  # {{{
+    return (self.keys[index], self.values[index])
+  #--------------------------------------------------------------------------}}}
+  def __delitem__(self, index):  # {{{
+    self.remove(index)
+  #--------------------------------------------------------------------------}}}
+  def __len__(self):  # {{{
+    return len(self.keys)
+  #--------------------------------------------------------------------------}}}
+  def __str__(self):  # {{{
+    return str(self.nodes)
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
+
+class _PairingNode(object): # {{{1
+  # A node of a PairingHeap. child is the first child and sibling is the next
+  # child of the same parent.
+  __slots__ = ('key', 'value', 'child', 'sibling')
+
+  def __init__(self, key, value): # {{{
+    self.key = key
+    self.value = value
+    self.child = None
+    self.sibling = None
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
+
+def _link(a, b): # {{{
+  # Make the root with the larger key the first child of the other root, and
+  # return the new root. Both a and b must be roots without siblings.
+  if b.key < a.key:
+    a, b = b, a
+  b.sibling = a.child
+  a.child = b
+  return a
+#----------------------------------------------------------------------------}}}
+
+class PairingHeap: # {{{1
+  # A pairing heap of (key, value) pairs. It is a heap-ordered tree where each
+  # node keeps its children in a linked list. add and meld are O(1): they
+  # link a new root under (or over) the old one. pop is O(log n) amortized:
+  # the children of the root are linked in pairs left to right, and then the
+  # pairs are linked right to left (the "two-pass" merge). It has the same
+  # add/pop/peek/len interface as Heap, so PQ can use either one.
+
+  def __init__(self, initial = []): # {{{
+    self.root = None
+    self.size = 0
+    for n in initial:
+      self.add(n)
+  #--------------------------------------------------------------------------}}}
+
+  def add(self, new_node): # {{{
+    # new_node is a tuple, new_node=(key,value)
+    node = _PairingNode(new_node[0], new_node[1])
+    self.root = node if self.root is None else _link(self.root, node)
+    self.size += 1
+  #--------------------------------------------------------------------------}}}
+  def meld(self, other): # {{{
+    # Move every node of the PairingHeap other into this one, in O(1). other is
+    # left empty.
+    if other.root is not None:
+      self.root = other.root if self.root is None else _link(self.root, other.root)
+    self.size += other.size
+    other.root = None
+    other.size = 0
+  #--------------------------------------------------------------------------}}}
+  def peek(self): # {{{
+    # Return the node (key, value) with the least key. Raise IndexError if the
+    # heap is empty.
+    if self.root is None:
+      raise IndexError("peek from empty heap")
+    return (self.root.key, self.root.value)
+  #--------------------------------------------------------------------------}}}
+  def pop(self): # {{{
+    # Remove and return the node (key, value) with the least key. Raise
+    # IndexError if the heap is empty.
+    root = self.root
+    if root is None:
+      raise IndexError("pop from empty heap")
+
+    # first pass: link the children in pairs, left to right
+    pairs = []
+    node = root.child
+    while node is not None:
+      a, b = node, node.sibling
+      if b is None:
+        a.sibling = None
+        pairs.append(a)
+        break
+      node = b.sibling
+      a.sibling = b.sibling = None
+      pairs.append(_link(a, b))
+
+    # second pass: link the pairs right to left
+    new_root = pairs.pop() if pairs else None
+    while pairs:
+      new_root = _link(pairs.pop(), new_root)
+
+    self.root = new_root
+    self.size -= 1
+    return (root.key, root.value)
+  #--------------------------------------------------------------------------}}}
+
+  @property
+  def nodes(self): # {{{
+    # The (key, value) pairs in preorder
+    ret = []
+    stack = [] if self.root is None else [self.root]
+    while stack:
+      node = stack.pop()
+      ret.append( (node.key, node.value) )
+      if node.sibling is not None:
+        stack.append(node.sibling)
+      if node.child is not None:
+        stack.append(node.child)
+    return ret
+  #--------------------------------------------------------------------------}}}
+
+  def __len__(self):  # {{{
+    return self.size
+  #--------------------------------------------------------------------------}}}
+  def __str__(self):  # {{{
+    return str(self.nodes)
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
+
+class PQ: # {{{1
+  # A min priority queue of (key, value) pairs. By default it is backed by a
+  # binary Heap. PQ(arity=d) uses a d-ary Heap instead, and PQ(pairing=True)
+  # uses a PairingHeap, which has O(1) add for insert-heavy workloads.
+
+  def __init__(self, initial = [], arity = 2, pairing = False): # {{{
+    if pairing:
+      self.elements = PairingHeap(initial=initial)
+    else:
+      self.elements = Heap(initial=initial, arity=arity)
+  #--------------------------------------------------------------------------}}}
+
+  def add(self, new_node):  # {{{
+    # Add new_node to the priority queue. The argument new_node is a tuple,
+    # new_node=(key,value)
+    self.elements.add(new_node)
+  #--------------------------------------------------------------------------}}}
+  def pop(self): # {{{
+    # Return the *value* (not the key) of the top of the priority queue. If the
+    # top is (k,v), it should return v. Raise an IndexError if the queue is
+    # empty.
+    return self.elements.pop()[1]
+  #--------------------------------------------------------------------------}}}
+  def peek(self): # {{{
+    # Return the value of the top of the priority queue without removing it.
+    return self.elements.peek()[1]
+  #--------------------------------------------------------------------------}}}
+
+  def __len__(self):  # {{{
+    return len(self.elements)
+  #--------------------------------------------------------------------------}}}
+  def __str__(self):  # {{{
+    return str(self.elements)
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
+
+def heapsort(L): # {{{
+  # Sort the list L in place in O(n log n) time and O(1) extra space. L is
+  # turned into a binary max-heap, and then the maximum is repeatedly swapped
+  # to the end of the shrinking heap.
+  def sift_down(index, size):
+    item = L[index]
+    child = 2*index + 1
+    while child < size:
+      if child + 1 < size and L[child] < L[child+1]:
+        child += 1
+      if not item < L[child]:
+        break
+      L[index] = L[child]
+      index = child
+      child = 2*index + 1
+    L[index] = item
+
+  n = len(L)
+  for index in range(n//2 - 1, -1, -1):
+    sift_down(index, n)
+  for end in range(n - 1, 0, -1):
+    L[0], L[end] = L[end], L[0]
+    sift_down(0, end)
+  return L
+#----------------------------------------------------------------------------}}}
+
+def merge_sorted(iterables, key = None): # {{{
+  # Lazily merge the sorted iterables into one sorted stream. Only the current
+  # head of each input is held in memory: a Heap of k nodes whose values are
+  # the input numbers. Ties are broken by input number, so the merge is
+  # stable.
+  if key is None:
+    key = lambda x: x
+
+  iterators = [ iter(it) for it in iterables ]
+  heads = [ None for _ in iterators ]
+  initial = []
+  for (i, it) in enumerate(iterators):
+    for x in it:
+      heads[i] = x
+      initial.append( ((key(x), i), i) )
+      break
+  H = Heap(initial=initial)
+
+  while len(H) != 0:
+    i = H.values[0]
+    yield heads[i]
+    for x in iterators[i]:
+      heads[i] = x
+      H.replace( ((key(x), i), i) )
+      break
+    else:
+      heads[i] = None
+      H.pop()
+#----------------------------------------------------------------------------}}}
+
+class _Reverse(object): # {{{1
+  # Wraps a key so that the order is reversed. Used to turn the min-Heap into
+  # a max-heap for nsmallest.
+  __slots__ = ('obj',)
+
+  def __init__(self, obj): # {{{
+    self.obj = obj
+  #--------------------------------------------------------------------------}}}
+  def __lt__(self, other): # {{{
+    return other.obj < self.obj
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
+
+def nsmallest(k, iterable, key = None): # {{{
+  # Return the k smallest items of iterable, smallest first, in O(n log k)
+  # time and O(k) memory. Equal items keep the order they came in.
+  if key is None:
+    key = lambda x: x
+  if k <= 0:
+    return []
+
+  # Max-heap of the k smallest items seen so far, keyed by (key, index) so that
+  # the latest of several equal items is the one evicted.
+  H = Heap()
+  for (i, x) in enumerate(iterable):
+    kx = key(x)
+    if len(H) < k:
+      H.add( (_Reverse((kx, i)), x) )
+    elif kx < H.keys[0].obj[0]:
+      H.replace( (_Reverse((kx, i)), x) )
+
+  best = sorted(zip(H.keys, H.values), key=lambda n: n[0].obj)
+  return [ x for (_, x) in best ]
+#----------------------------------------------------------------------------}}}
+def nlargest(k, iterable, key = None): # {{{
+  # Return the k largest items of iterable, largest first, in O(n log k) time
+  # and O(k) memory. Equal items keep the order they came in.
+  if key is None:
+    key = lambda x: x
+  if k <= 0:
+    return []
+
+  # Min-heap of the k largest items seen so far, keyed by (key, -index) so that
+  # the latest of several equal items is the one evicted.
+  H = Heap()
+  for (i, x) in enumerate(iterable):
+    kx = key(x)
+    if len(H) < k:
+      H.add( ((kx, -i), x) )
+    elif H.keys[0][0] < kx:
+      H.replace( ((kx, -i), x) )
+
+  best = sorted(zip(H.keys, H.values), key=lambda n: n[0], reverse=True)
+  return [ x for (_, x) in best ]
+#----------------------------------------------------------------------------}}}
+
+class priority_dict(dict):  # {{{1
+  # A dictionary that maintains a heap with items in the dictionary sorted
+  # according to the dictionary keys. It is a subclass of the dictionary class.
+  # You can read about dictionaries here:
+  #
+  #   https://docs.python.org/2/library/stdtypes.html#typesmapping
+  #
+  # Methods from the dictionary superclass are inherited, but some (like
+  # dict.update or dict.clear) bypass the heap and should not be used.
+  #
+  # The heap is an indexed binary heap: priority_dict._keys and
+  # priority_dict._values are the heap in two parallel lists, and
+  # priority_dict._pos maps every value to its slot in the heap. Updating a key
+  # moves the value up or down from its slot in O(log n), so there are never
+  # outdated duplicates in the heap and memory stays proportional to the number
+  # of values in the dictionary.
+  #
+  # priority_dict.pop() -- returns and removes the element with the least key
+  # priority_dict.peek() -- returns and does not remove the element with the
+  #   least key
+  # priority_dict.push(value,key) -- adds the (key, value) pair to the heap
+  # priority_dict.update_key(value,key) -- updates the key of value to key,
+  #   adding value if it is not there. Works for increases and decreases.
+  # priority_dict.delete(value) -- removes value, wherever it is in the heap
+
+  def __init__(self, *args, **kwargs):  # {{{
+    # call the dictionary __init__ from the superclass
+    super(priority_dict, self).__init__(*args, **kwargs)
+    self._rebuild()  # sets up the heap
+  #--------------------------------------------------------------------------}}}
+
+  def _rebuild(self):  # {{{
+    # The heap likes key to come before value, but we store it backwards in the
+    # dictionary. Floyd's bottom-up construction is O(n).
+    self._values = list(super(priority_dict, self).keys())
+    self._keys = [ dict.__getitem__(self, value) for value in self._values ]
+    self._pos = dict( (value, i) for (i, value) in enumerate(self._values) )
+    for index in range(len(self._values)//2 - 1, -1, -1):
+      self._heapify_down(index)
+  #--------------------------------------------------------------------------}}}
+  def _heapify_up(self, index):  # {{{
+    keys, values, pos = self._keys, self._values, self._pos
+    key, value = keys[index], values[index]
+    while index > 0:
+      parent = (index - 1) >> 1
+      if not key < keys[parent]:
+        break
+      keys[index] = keys[parent]
+      values[index] = values[parent]
+      pos[values[index]] = index
+      index = parent
+    keys[index] = key
+    values[index] = value
+    pos[value] = index
+  #--------------------------------------------------------------------------}}}
+  def _heapify_down(self, index):  # {{{
+    keys, values, pos = self._keys, self._values, self._pos
+    size = len(keys)
+    key, value = keys[index], values[index]
+    child = 2*index + 1
+    while child < size:
+      if child + 1 < size and keys[child+1] < keys[child]:
+        child += 1
+      if not keys[child] < key:
+        break
+      keys[index] = keys[child]
+      values[index] = values[child]
+      pos[values[index]] = index
+      index = child
+      child = 2*index + 1
+    keys[index] = key
+    values[index] = value
+    pos[value] = index
+  #--------------------------------------------------------------------------}}}
+  def _remove_at(self, index):  # {{{
+    # Remove the heap slot index, filling it with the last slot.
+    keys, values = self._keys, self._values
+    del self._pos[values[index]]
+    last_key, last_value = keys.pop(), values.pop()
+    if index == len(keys):
+      return
+    keys[index], values[index] = last_key, last_value
+    if index > 0 and last_key < keys[(index - 1) >> 1]:
+      self._heapify_up(index)
+    else:
+      self._heapify_down(index)
+  #--------------------------------------------------------------------------}}}
+
+  def pop(self):  # {{{
+    # Raises IndexError if heap is empty
+    if not self._values:
+      raise IndexError("pop from empty priority_dict")
+    value = self._values[0]
+    self._remove_at(0)
+    super(priority_dict, self).__delitem__(value)
+    return value
+  #--------------------------------------------------------------------------}}}
+  def peek(self):  # {{{
+    # Raises IndexError if heap is empty.
+    if not self._values:
+      raise IndexError("peek from empty priority_dict")
+    return self._values[0]
+  #--------------------------------------------------------------------------}}}
+  def push(self, value, key):  # {{{
+    # adds (key,value) to heap and to the dictionary
+    self.update_key(value, key)
+  #--------------------------------------------------------------------------}}}
+  def update_key(self, value, key):  # {{{
+    # Update the key for value in place, moving it up for a decrease and down
+    # for an increase. If value is new, it is added.
+    super(priority_dict, self).__setitem__(value, key)
+    index = self._pos.get(value)
+    if index is None:
+      self._keys.append(key)
+      self._values.append(value)
+      self._heapify_up(len(self._values) - 1)
+      return
+    old_key = self._keys[index]
+    self._keys[index] = key
+    if key < old_key:
+      self._heapify_up(index)
+    else:
+      self._heapify_down(index)
+  #--------------------------------------------------------------------------}}}
+  def delete(self, value):  # {{{
+    # Remove value from the dictionary and the heap. Raises KeyError if it is
+    # not there.
+    super(priority_dict, self).__delitem__(value)
+    self._remove_at(self._pos[value])
+  #--------------------------------------------------------------------------}}}
+
+  def __setitem__(self, value, key):  # {{{
+    self.update_key(value, key)
+  #--------------------------------------------------------------------------}}}
+  def __delitem__(self, value):  # {{{
+    self.delete(value)
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
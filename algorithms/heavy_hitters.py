@@ -0,0 +1,156 @@
+# imports {{{1
+from __future__ import division
+from array import array
+from random import Random
+#---------------------------------------------------------------------------}}}1
+
+# Frequent elements of a sequence, in one pass and little memory. The exact
+# finders make a second pass to check their candidates, so they take
+# something that can be iterated twice: a list, an array, or a function
+# returning a fresh iterator (to re-read a stream from disk, say). They raise
+# TypeError for an iterator, which the first pass would use up; a stream
+# seen once goes to majority_candidate, misra_gries or heavy_hitters.
+
+def _passes(items): # {{{
+  # an iterator over items, for each pass
+  if callable(items):
+    return items()
+  it = iter(items)
+  if it is items:
+    raise TypeError("an iterator can only be read once; pass a sequence or "
+                    "a function returning a fresh iterator, or use "
+                    "majority_candidate, misra_gries or heavy_hitters")
+  return it
+#----------------------------------------------------------------------------}}}
+
+def majority_candidate(stream): # {{{
+  # Boyer-Moore vote: returns (candidate, n) for an iterable of n items. If
+  # some item fills more than half of the stream, it is the candidate. O(n)
+  # time and O(1) space, in one pass.
+  candidate, votes, n = None, 0, 0
+  for x in stream:
+    n += 1
+    if votes == 0:
+      candidate, votes = x, 1
+    elif x == candidate:
+      votes += 1
+    else:
+      votes -= 1
+  return candidate, n
+#----------------------------------------------------------------------------}}}
+def majority(items): # {{{
+  # The item that occurs more than len/2 times in items, or None if there is
+  # none. The Boyer-Moore candidate is verified with a second counting pass.
+  candidate, n = majority_candidate(_passes(items))
+  if n == 0:
+    return None
+  count = sum(1 for x in _passes(items) if x == candidate)
+  return candidate if 2*count > n else None
+#----------------------------------------------------------------------------}}}
+
+def misra_gries(stream, k): # {{{
+  # Misra-Gries summary with k-1 counters: returns (counters, n), where
+  # counters is a dictionary holding every item that occurs more than n/k
+  # times (and maybe others), with a count at most n/k below the true one.
+  # O(n) amortized time and O(k) space, in one pass. k = 2 is the
+  # Boyer-Moore vote.
+  if k < 2:
+    raise ValueError("misra_gries needs k >= 2")
+  counters = dict()
+  n = 0
+  for x in stream:
+    n += 1
+    if x in counters:
+      counters[x] += 1
+    elif len(counters) < k - 1:
+      counters[x] = 1
+    else:
+      # decrement everything; paid for by the increments that built it up
+      for y in list(counters):
+        counters[y] -= 1
+        if counters[y] == 0:
+          del counters[y]
+  return counters, n
+#----------------------------------------------------------------------------}}}
+def frequent(items, k): # {{{
+  # A dictionary from each item that occurs more than len/k times in items to
+  # its exact count: the Misra-Gries candidates, counted in a second pass.
+  counters, n = misra_gries(_passes(items), k)
+  counts = dict( (x, 0) for x in counters )
+  for x in _passes(items):
+    if x in counts:
+      counts[x] += 1
+  return dict( (x, c) for (x, c) in counts.items() if k*c > n )
+#----------------------------------------------------------------------------}}}
+
+_PRIME = 2**61 - 1
+
+class CountMinSketch: # {{{1
+  # Approximate counts of the items of an unbounded stream in fixed memory.
+  # There are depth rows of width counters, and row r counts item x in
+  # column ((a_r * hash(x) + b_r) mod p) mod width, for the prime p = 2^61-1
+  # and random a_r, b_r, so the rows hash independently. An estimate is the
+  # smallest of the depth counters of x: it is never below the true count,
+  # and it is at most e/width * n above it with probability 1 - exp(-depth).
+  #
+  # CountMinSketch.total -- the number of items added (n)
+
+  def __init__(self, width = 2**12, depth = 4, seed = 0): # {{{
+    rng = Random(seed)
+    self.width = width
+    self.depth = depth
+    self.hashes = [ (rng.randrange(1, _PRIME), rng.randrange(_PRIME))
+                    for _ in range(depth) ]
+    self.rows = [ array('l', [0]) * width for _ in range(depth) ]
+    self.total = 0
+  #--------------------------------------------------------------------------}}}
+
+  def add(self, x, count = 1): # {{{
+    # Count x count more times, and return its new estimate.
+    self.total += count
+    width = self.width
+    h = hash(x)
+    estimate = None
+    for ((a, b), row) in zip(self.hashes, self.rows):
+      column = (a*h + b) % _PRIME % width
+      row[column] += count
+      if estimate is None or row[column] < estimate:
+        estimate = row[column]
+    return estimate
+  #--------------------------------------------------------------------------}}}
+  def estimate(self, x): # {{{
+    width = self.width
+    h = hash(x)
+    return min( row[(a*h + b) % _PRIME % width]
+                for ((a, b), row) in zip(self.hashes, self.rows) )
+  #--------------------------------------------------------------------------}}}
+  def __len__(self): # {{{
+    return self.total
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
+
+def heavy_hitters(stream, phi, width = 2**12, depth = 4, seed = 0): # {{{
+  # Approximate heavy hitters of a stream seen once: a dictionary from the
+  # items whose estimated count is at least phi*n to that estimate. Every
+  # item that really occurs phi*n times is found. Besides the sketch, only
+  # the current candidates are kept; they are pruned whenever there are more
+  # than 2/phi of them, so the memory is bounded for an unbounded stream.
+  sketch = CountMinSketch(width, depth, seed)
+  candidates = dict()
+  for x in stream:
+    estimate = sketch.add(x)
+    if estimate >= phi * sketch.total:
+      candidates[x] = estimate
+      if len(candidates) > 2 / phi:
+        candidates = _prune(sketch, candidates, phi)
+  return _prune(sketch, candidates, phi)
+#----------------------------------------------------------------------------}}}
+def _prune(sketch, candidates, phi): # {{{
+  threshold = phi * sketch.total
+  ret = dict()
+  for x in candidates:
+    estimate = sketch.estimate(x)
+    if estimate >= threshold:
+      ret[x] = estimate
+  return ret
+#----------------------------------------------------------------------------}}}
@@ -0,0 +1,252 @@
+# imports {{{1
+from __future__ import division
+from collections import deque
+from functools import reduce
+from multiprocessing.sharedctypes import RawArray
+import ctypes
+import multiprocessing
+#---------------------------------------------------------------------------}}}1
+
+# The maximum subarray problem (MSP): find the slice A[start:end] with the
+# largest sum. The answers are triples (start, end, sum) with end exclusive,
+# like HW10's MSP_bad.
+
+class KadaneStream: # {{{1
+  # Kadane's algorithm, fed one chunk at a time. Only the running state is
+  # kept (the smallest prefix sum so far and the best slice), so a stream too
+  # large for memory can be scanned in one O(n) pass:
+  #
+  #   K = KadaneStream()
+  #   for chunk in chunks:
+  #     K.extend(chunk)
+  #   (start, end, total) = K.result()
+  #
+  # The indices count from the start of the stream. With allow_empty=True
+  # the empty slice (0,0,0) is allowed, as in MSP_bad, so the sum is never
+  # negative; otherwise the best slice has at least one element.
+
+  def __init__(self, allow_empty = True): # {{{
+    self.allow_empty = allow_empty
+    self.count = 0            # numbers seen
+    self.prefix = 0           # their sum
+    self.min_prefix = 0       # the smallest prefix sum seen, and where
+    self.min_index = 0
+    if allow_empty:
+      self.best = (0, 0, 0)
+    else:
+      self.best = (0, 0, float("-inf"))
+  #--------------------------------------------------------------------------}}}
+
+  def extend(self, values): # {{{
+    # Consume the numbers in values. Returns self.
+    count, prefix = self.count, self.prefix
+    min_prefix, min_index = self.min_prefix, self.min_index
+    best_sum = self.best[2]
+    best = None
+    for x in values:
+      prefix += x
+      count += 1
+      # The best slice ending here starts at the smallest earlier prefix.
+      # min_prefix is only updated below, so the slice is never empty.
+      if prefix - min_prefix > best_sum:
+        best_sum = prefix - min_prefix
+        best = (min_index, count)
+      if prefix < min_prefix:
+        min_prefix, min_index = prefix, count
+    if best is not None:
+      self.best = best + (best_sum,)
+    self.count, self.prefix = count, prefix
+    self.min_prefix, self.min_index = min_prefix, min_index
+    return self
+  #--------------------------------------------------------------------------}}}
+  def result(self): # {{{
+    # (start, end, sum) of the best slice of everything consumed so far
+    return self.best
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
+
+def kadane(A, allow_empty = True): # {{{
+  # (start, end, sum) of a maximum subarray of A in O(n), see KadaneStream.
+  return KadaneStream(allow_empty).extend(A).result()
+#----------------------------------------------------------------------------}}}
+def kadane_chunks(chunks, allow_empty = True): # {{{
+  # The same for a stream given as an iterable of chunks (lists, arrays, or
+  # anything iterable), holding one chunk at a time.
+  K = KadaneStream(allow_empty)
+  for chunk in chunks:
+    K.extend(chunk)
+  return K.result()
+#----------------------------------------------------------------------------}}}
+
+def max_window_sum(A, k): # {{{
+  # (start, end, sum) of the nonempty slice of A with the largest sum among
+  # those of length at most k. The slice ending at j is best when it starts
+  # at the smallest prefix sum P[i] with j-k <= i < j, and a deque of the
+  # candidate i, with increasing P[i], gives that minimum in O(1) amortized.
+  # O(n) time and O(k) memory, and A can be any iterable.
+  if k < 1:
+    raise ValueError("the window must hold at least one element")
+  window = deque([ (0, 0) ])    # (i, P[i]) with increasing P[i]
+  best = None
+  prefix = 0
+  j = 0
+  for x in A:
+    prefix += x
+    j += 1
+    if window[0][0] < j - k:
+      window.popleft()
+    (i, p) = window[0]
+    if best is None or prefix - p > best[2]:
+      best = (i, j, prefix - p)
+    while window and window[-1][1] >= prefix:
+      window.pop()
+    window.append( (j, prefix) )
+  if best is None:
+    raise ValueError("max_window_sum of an empty sequence")
+  return best
+#----------------------------------------------------------------------------}}}
+
+# Segment summaries. The summary of a nonempty slice A[lo:hi] is a tuple
+#
+#   (total, (prefix, end), (suffix, start), (best, start, end))
+#
+# of its sum, its best prefix A[lo:end], its best suffix A[start:hi] and its
+# best nonempty subarray, with absolute indices. The summary of two adjacent
+# slices follows from theirs (combine), and combine is associative, so a long
+# array can be summarized in pieces, in parallel or in a segment tree. None
+# is the summary of the empty slice.
+
+def summarize(A, lo = 0, hi = None): # {{{
+  # The summary of A[lo:hi], in one pass.
+  if hi is None:
+    hi = len(A)
+  if hi <= lo:
+    return None
+  prefix = 0
+  best_prefix = None
+  min_prefix, min_index = 0, lo     # smallest prefix before the current end
+  best = None
+  for j in range(lo, hi):
+    prefix += A[j]
+    if best_prefix is None or prefix > best_prefix[0]:
+      best_prefix = (prefix, j + 1)
+    if best is None or prefix - min_prefix > best[0]:
+      best = (prefix - min_prefix, min_index, j + 1)
+    if prefix < min_prefix and j + 1 < hi:
+      min_prefix, min_index = prefix, j + 1
+  # the best suffix starts right after the smallest proper prefix
+  return (prefix, best_prefix, (prefix - min_prefix, min_index), best)
+#----------------------------------------------------------------------------}}}
+def combine(L, R): # {{{
+  # The summary of the concatenation of two adjacent slices, L on the left.
+  if L is None:
+    return R
+  if R is None:
+    return L
+  (l_total, l_prefix, l_suffix, l_best) = L
+  (r_total, r_prefix, r_suffix, r_best) = R
+  prefix = max(l_prefix, (l_total + r_prefix[0], r_prefix[1]))
+  suffix = max(r_suffix, (r_total + l_suffix[0], l_suffix[1]))
+  middle = (l_suffix[0] + r_prefix[0], l_suffix[1], r_prefix[1])
+  return (l_total + r_total, prefix, suffix, max(l_best, r_best, middle))
+#----------------------------------------------------------------------------}}}
+def _triple(S): # {{{
+  # (start, end, sum) of the best subarray of the summary S
+  (best, start, end) = S[3]
+  return (start, end, best)
+#----------------------------------------------------------------------------}}}
+
+def parallel_msp(A, processes = None, chunk_size = None, typecode = 'd'): # {{{
+  # (start, end, sum) of a maximum nonempty subarray of A, computed in a pool
+  # of processes (cpu_count() by default). A is copied once into shared
+  # memory, a multiprocessing RawArray of the given typecode (or used as it
+  # is if it already is one), and every worker summarizes its chunks in
+  # place, so only the small summaries are sent back. They are combined in
+  # order.
+  n = len(A)
+  if n == 0:
+    raise ValueError("parallel_msp of an empty sequence")
+  if not isinstance(A, ctypes.Array):
+    A = RawArray(typecode, A)
+  if processes is None:
+    processes = multiprocessing.cpu_count()
+  if chunk_size is None:
+    chunk_size = max(-(-n // (4*processes)), 1)
+  ranges = [ (lo, min(lo + chunk_size, n)) for lo in range(0, n, chunk_size) ]
+
+  pool = multiprocessing.Pool(processes, _init_worker, (A,))
+  try:
+    summaries = pool.map(_worker_summarize, ranges)
+  finally:
+    pool.close()
+    pool.join()
+  return _triple(reduce(combine, summaries))
+#----------------------------------------------------------------------------}}}
+
+_worker_array = None
+
+def _init_worker(A): # {{{
+  global _worker_array
+  _worker_array = A
+#----------------------------------------------------------------------------}}}
+def _worker_summarize(lo_hi): # {{{
+  (lo, hi) = lo_hi
+  return summarize(_worker_array, lo, hi)
+#----------------------------------------------------------------------------}}}
+
+class MSPTree: # {{{1
+  # A segment tree of summaries over an array, for maximum subarray queries
+  # on any range A[lo:hi] in O(log n), with point updates in O(log n).
+  #
+  # MSPTree.tree[size + i] is the summary of A[i] and every inner node k
+  # holds combine(tree[2k], tree[2k+1]); size is n rounded up to a power of
+  # two, and the leaves past n hold None.
+
+  def __init__(self, A): # {{{
+    self.n = n = len(A)
+    size = 1
+    while size < n:
+      size *= 2
+    self.size = size
+    self.tree = tree = [ None ] * (2*size)
+    for (i, x) in enumerate(A):
+      tree[size + i] = (x, (x, i + 1), (x, i), (x, i, i + 1))
+    for k in range(size - 1, 0, -1):
+      tree[k] = combine(tree[2*k], tree[2*k + 1])
+  #--------------------------------------------------------------------------}}}
+
+  def update(self, i, x): # {{{
+    # Set A[i] = x.
+    tree = self.tree
+    k = self.size + i
+    tree[k] = (x, (x, i + 1), (x, i), (x, i, i + 1))
+    k //= 2
+    while k >= 1:
+      tree[k] = combine(tree[2*k], tree[2*k + 1])
+      k //= 2
+  #--------------------------------------------------------------------------}}}
+  def query(self, lo, hi): # {{{
+    # (start, end, sum) of a maximum nonempty subarray of A[lo:hi]. The
+    # summaries to the left and to the right are collected separately, since
+    # combine is not commutative.
+    if not 0 <= lo < hi <= self.n:
+      raise IndexError("MSPTree.query needs 0 <= lo < hi <= len")
+    tree = self.tree
+    left = right = None
+    lo += self.size
+    hi += self.size
+    while lo < hi:
+      if lo & 1:
+        left = combine(left, tree[lo])
+        lo += 1
+      if hi & 1:
+        hi -= 1
+        right = combine(tree[hi], right)
+      lo //= 2
+      hi //= 2
+    return _triple(combine(left, right))
+  #--------------------------------------------------------------------------}}}
+  def __len__(self): # {{{
+    return self.n
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
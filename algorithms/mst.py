@@ -0,0 +1,97 @@
+# imports {{{1
+from __future__ import division
+from array import array
+from math import log
+
+from algorithms.graph import weighted_graph
+from algorithms.heap import priority_dict
+from algorithms.union_find import UnionFind
+#---------------------------------------------------------------------------}}}1
+
+def minimum_spanning_forest(G, w = None, method = "auto", root = None): # {{{
+  # Minimum spanning forest of the undirected graph G, with weights as for
+  # algorithms.shortest_paths.dijkstra. Returns (edges, total), where edges is
+  # the list of tree edges (u,v) and total is their weight. A disconnected G
+  # gets one tree per component.
+  #
+  # method is "prim", "kruskal" or "auto". Auto picks Prim when the average
+  # degree is at least log2(V), where its O(E log V) heap work beats sorting
+  # all the edges, and Kruskal for sparser graphs. root is the node Prim
+  # starts from.
+  G = weighted_graph(G, w)
+  if G.directed:
+    raise ValueError("minimum spanning trees need an undirected graph")
+
+  if method == "auto":
+    n = len(G)
+    method = "prim" if n > 1 and len(G.targets) >= n*log(n, 2) else "kruskal"
+  if method == "prim":
+    return prim(G, root=root)
+  if method == "kruskal":
+    return kruskal(G)
+  raise ValueError("unknown MST method %r" % (method,))
+#----------------------------------------------------------------------------}}}
+
+def prim(G, w = None, root = None): # {{{
+  # Prim's algorithm with an indexed heap: every node outside the tree is keyed
+  # by its cheapest edge into the tree, and the key is lowered in place when a
+  # cheaper edge shows up. O(E log V). Each component is grown from its
+  # smallest node (or from root, for root's component).
+  G = weighted_graph(G, w)
+  offsets, targets, weights = G.offsets, G.targets, G.weights
+  inf = float("inf")
+  in_tree = bytearray(len(G))
+  best = [ inf for _ in G.nodes ]
+  pred = array('i', [-1]) * len(G)
+  edges = []
+  total = 0
+
+  starts = G.nodes if root is None else [root] + list(G.nodes)
+  for start in starts:
+    if in_tree[start]:
+      continue
+    H = priority_dict({start: 0})
+    while H:
+      u = H.pop()
+      in_tree[u] = 1
+      if pred[u] != -1:
+        edges.append( (pred[u], u) )
+        total += best[u]
+      for i in range(offsets[u], offsets[u+1]):
+        v = targets[i]
+        if not in_tree[v] and weights[i] < best[v]:
+          best[v] = weights[i]
+          pred[v] = u
+          H.update_key(v, weights[i])
+  return edges, total
+#----------------------------------------------------------------------------}}}
+
+def kruskal(G, w = None): # {{{
+  # Kruskal's algorithm: sort the edges by weight, then scan them and keep
+  # every edge that joins two different components of a UnionFind.
+  # O(E log E), dominated by the sort.
+  G = weighted_graph(G, w)
+  offsets, targets, weights = G.offsets, G.targets, G.weights
+
+  # each undirected edge is stored twice; keep the copy with u < v
+  us = array('i')
+  idx = array('i')
+  for u in G.nodes:
+    for i in range(offsets[u], offsets[u+1]):
+      if u < targets[i]:
+        us.append(u)
+        idx.append(i)
+  order = sorted(range(len(idx)), key=lambda j: weights[idx[j]])
+
+  components = UnionFind(len(G))
+  edges = []
+  total = 0
+  for j in order:
+    u, i = us[j], idx[j]
+    if components.union(u, targets[i]):
+      edges.append( (u, targets[i]) )
+      total += weights[i]
+      if len(edges) == len(G) - 1:
+        break
+  return edges, total
+#----------------------------------------------------------------------------}}}
@@ -0,0 +1,146 @@
+# imports {{{1
+from __future__ import division
+from array import array
+from collections import OrderedDict
+import multiprocessing
+
+from algorithms.graph import CSRGraph, weighted_graph
+from algorithms.shortest_paths import dijkstra, path_to
+#---------------------------------------------------------------------------}}}1
+
+class PathService: # {{{1
+  # Answers batches of shortest path queries (s,t) on a fixed weighted graph.
+  #
+  # The queries of a batch are grouped by source, and one dijkstra is run per
+  # distinct source (in a process pool if PathService.processes > 1). The
+  # resulting shortest path trees are kept in an LRU cache, so repeated or
+  # overlapping queries from the same source are answered by array lookups.
+  #
+  # PathService.max_bytes caps the memory of the cached trees. A tree is an
+  # array('d') of distances and an array('i') of predecessors, 12 bytes per
+  # node, and the least recently used trees are dropped to stay under the cap.
+  #
+  # PathService.query(pairs) -- list of costs of the queries pairs
+  # PathService.query_paths(pairs) -- list of (path, cost) for the queries
+  # PathService.tree(s) -- the cached (dist, pred) pair for the source s
+
+  def __init__(self, G, w = None, max_bytes = 64*2**20, processes = 1): # {{{
+    # G, w are as for dijkstra.
+    self.G = weighted_graph(G, w)
+    self.max_bytes = max_bytes
+    self.processes = processes
+    self._cache = OrderedDict()   # source -> (dist, pred), oldest first
+    self._bytes = 0
+    self.hits = 0
+    self.misses = 0
+  #--------------------------------------------------------------------------}}}
+
+  def _tree_bytes(self, tree): # {{{
+    dist, pred = tree
+    return dist.itemsize*len(dist) + pred.itemsize*len(pred)
+  #--------------------------------------------------------------------------}}}
+  def _lookup(self, s): # {{{
+    # The cached tree for s (now the most recently used), or None
+    tree = self._cache.pop(s, None)
+    if tree is not None:
+      self._cache[s] = tree
+      self.hits += 1
+    return tree
+  #--------------------------------------------------------------------------}}}
+  def _store(self, s, tree): # {{{
+    size = self._tree_bytes(tree)
+    if size > self.max_bytes:
+      return
+    self._cache[s] = tree
+    self._bytes += size
+    while self._bytes > self.max_bytes:
+      _, old = self._cache.popitem(last=False)
+      self._bytes -= self._tree_bytes(old)
+  #--------------------------------------------------------------------------}}}
+
+  def tree(self, s): # {{{
+    # (dist, pred) for the source s, from the cache or a new dijkstra
+    tree = self._lookup(s)
+    if tree is None:
+      self.misses += 1
+      tree = _tree(self.G, s)
+      self._store(s, tree)
+    return tree
+  #--------------------------------------------------------------------------}}}
+
+  def _trees(self, sources): # {{{
+    # Generate (s, (dist, pred)) for every distinct source, computing the
+    # missing trees in a process pool when there is more than one.
+    missing = []
+    for s in sources:
+      tree = self._lookup(s)
+      if tree is None:
+        missing.append(s)
+      else:
+        yield s, tree
+    self.misses += len(missing)
+
+    if self.processes > 1 and len(missing) > 1:
+      G = self.G
+      pool = multiprocessing.Pool(self.processes, _init_worker,
+                                  (G.offsets, G.targets, G.weights, G.directed))
+      try:
+        for (s, tree) in pool.imap_unordered(_worker_tree, missing):
+          self._store(s, tree)
+          yield s, tree
+      finally:
+        pool.close()
+        pool.join()
+    else:
+      for s in missing:
+        tree = _tree(self.G, s)
+        self._store(s, tree)
+        yield s, tree
+  #--------------------------------------------------------------------------}}}
+  def _answer(self, pairs, answer): # {{{
+    # Group the queries by source and call answer(tree, t) for each one. The
+    # answers come back in the order of pairs.
+    by_source = OrderedDict()
+    for (i, (s, t)) in enumerate(pairs):
+      by_source.setdefault(s, []).append( (i, t) )
+
+    results = [ None for _ in pairs ]
+    for (s, tree) in self._trees(list(by_source)):
+      for (i, t) in by_source[s]:
+        results[i] = answer(tree, t)
+    return results
+  #--------------------------------------------------------------------------}}}
+
+  def query(self, pairs): # {{{
+    # Return the list of shortest path costs for the queries (s,t) in pairs.
+    # The cost is inf if t can't be reached from s.
+    return self._answer(pairs, lambda tree, t: tree[0][t])
+  #--------------------------------------------------------------------------}}}
+  def query_paths(self, pairs): # {{{
+    # Return the list of (path, cost) for the queries (s,t) in pairs, with
+    # (None, inf) if t can't be reached from s.
+    def answer(tree, t):
+      dist, pred = tree
+      if dist[t] == float("inf"):
+        return None, dist[t]
+      return path_to(pred, t), dist[t]
+    return self._answer(pairs, answer)
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1
+
+def _tree(G, s): # {{{
+  dist, pred = dijkstra(G, None, s)
+  return array('d', dist), pred
+#----------------------------------------------------------------------------}}}
+
+_worker_graph = None
+
+def _init_worker(offsets, targets, weights, directed): # {{{
+  # Runs once in each pool process, so the graph is sent once per worker
+  # rather than once per source.
+  global _worker_graph
+  _worker_graph = CSRGraph.from_arrays(offsets, targets, weights, directed)
+#----------------------------------------------------------------------------}}}
+def _worker_tree(s): # {{{
+  return s, _tree(_worker_graph, s)
+#----------------------------------------------------------------------------}}}
@@ -0,0 +1,83 @@
+# imports {{{1
+from __future__ import division
+from array import array
+from itertools import compress
+#---------------------------------------------------------------------------}}}1
+
+def sieve(n): # {{{
+  # Sieve of Eratosthenes: a bytearray of length n+1 whose entry k is 1 when k
+  # is prime. Every multiple of p from p*p on is cleared by one slice
+  # assignment, so the inner loop runs in C. O(n log log n) time, one byte
+  # per number.
+  if n < 2:
+    return bytearray(max(n + 1, 0))
+  is_prime = bytearray([1]) * (n + 1)
+  is_prime[0] = is_prime[1] = 0
+  p = 2
+  while p*p <= n:
+    if is_prime[p]:
+      is_prime[p*p::p] = bytearray((n - p*p) // p + 1)
+    p += 1
+  return is_prime
+#----------------------------------------------------------------------------}}}
+def primes_up_to(n): # {{{
+  # The list of primes p <= n.
+  return list(compress(range(n + 1), sieve(n)))
+#----------------------------------------------------------------------------}}}
+
+def primes_in_range(lo, hi, segment_size = 2**20): # {{{
+  # Generate the primes p with lo <= p < hi, in order. This is a segmented
+  # sieve: only the primes up to sqrt(hi) are kept, and the range is sieved
+  # one segment of segment_size numbers at a time, so the memory stays
+  # O(sqrt(hi) + segment_size) however far the range goes (10^10 and
+  # beyond).
+  lo = max(lo, 2)
+  if hi <= lo:
+    return
+  root = _isqrt(hi - 1)
+  base = primes_up_to(root)
+  for start in range(lo, hi, segment_size):
+    end = min(start + segment_size, hi)
+    segment = bytearray([1]) * (end - start)
+    for p in base:
+      if p*p >= end:
+        break
+      # the first multiple of p in the segment, but not p itself
+      first = max(p*p, (start + p - 1) // p * p)
+      if first < end:
+        segment[first - start::p] = bytearray((end - 1 - first) // p + 1)
+    for q in compress(range(start, end), segment):
+      yield q
+#----------------------------------------------------------------------------}}}
+
+# prefix counts of the primes, extended on demand by prime_pi
+_pi_table = array('i', [0])
+
+def prime_pi(n): # {{{
+  # pi(n), the number of primes <= n. The counts for every k up to the
+  # largest n asked for so far are cached in an array('i') (4 bytes per
+  # number), so after the first query up to n each one is a lookup. The table
+  # is rebuilt at least twice as large when it runs out.
+  global _pi_table
+  if n < 0:
+    return 0
+  if n >= len(_pi_table):
+    limit = max(n, 2*len(_pi_table))
+    table = array('i', [0]) * (limit + 1)
+    count = 0
+    for (k, flag) in enumerate(sieve(limit)):
+      count += flag
+      table[k] = count
+    _pi_table = table
+  return _pi_table[n]
+#----------------------------------------------------------------------------}}}
+
+def _isqrt(n): # {{{
+  # floor(sqrt(n)), exact for large n
+  r = int(n**0.5)
+  while r*r > n:
+    r -= 1
+  while (r + 1)*(r + 1) <= n:
+    r += 1
+  return r
+#----------------------------------------------------------------------------}}}
@@ -0,0 +1,85 @@
+# imports {{{1
+from __future__ import division
+from itertools import islice
+from math import exp, floor, log
+import random
+try:
+  from itertools import izip
+except ImportError:   # python 3, where zip is lazy
+  izip = zip
+
+from algorithms.heap import nlargest
+
+try:
+  import numpy as np
+except ImportError:   # only np_permutation needs numpy
+  np = None
+#---------------------------------------------------------------------------}}}1
+
+# Random permutations and samples. rng is a random.Random for reproducible
+# results, or None to use the global generator of the random module.
+
+def shuffle(L, rng = None): # {{{
+  # Shuffle the list L in place with Fisher-Yates, and return it: position i
+  # (from the end down) swaps with a uniform position j <= i, so all n!
+  # orders are equally likely and it takes O(n) time.
+  randrange = (rng or random).randrange
+  for i in range(len(L) - 1, 0, -1):
+    j = randrange(i + 1)
+    L[i], L[j] = L[j], L[i]
+  return L
+#----------------------------------------------------------------------------}}}
+def permutation(n, rng = None): # {{{
+  # A uniformly random permutation of range(n), as a list.
+  return shuffle(list(range(n)), rng)
+#----------------------------------------------------------------------------}}}
+def np_permutation(n, seed = None): # {{{
+  # A uniformly random permutation of range(n) as a numpy array, drawn in C.
+  if np is None:
+    raise ImportError("np_permutation needs numpy")
+  return np.random.default_rng(seed).permutation(n)
+#----------------------------------------------------------------------------}}}
+
+def reservoir_sample(stream, k, rng = None): # {{{
+  # A uniform sample of k items (without replacement) from an iterable of
+  # unknown length, in one pass and O(k) memory; all of them if there are
+  # fewer than k. This is Li's Algorithm L: rather than drawing for every
+  # item, it draws the geometric gap to the next item that enters the
+  # reservoir and skips ahead, so it makes O(k log(n/k)) draws.
+  rng = rng or random
+  stream = iter(stream)
+  reservoir = list(islice(stream, k))
+  if len(reservoir) < k or k == 0:
+    return reservoir
+  w = exp(log(_positive(rng)) / k)
+  while True:
+    gap = int(floor(log(_positive(rng)) / log(1 - w)))
+    item = next(islice(stream, gap, None), _END)
+    if item is _END:
+      return reservoir
+    reservoir[rng.randrange(k)] = item
+    w *= exp(log(_positive(rng)) / k)
+#----------------------------------------------------------------------------}}}
+def weighted_sample(items, weights, k, rng = None): # {{{
+  # k of the items without replacement, where each draw picks among the
+  # remaining items with probability proportional to weight. This is the
+  # Efraimidis-Spirakis method: item i gets the key u_i^(1/w_i) for a uniform
+  # u_i, and the k largest keys win. The keys are compared as log(u_i)/w_i,
+  # and only k of them are kept (algorithms.heap.nlargest), so items and
+  # weights can be streams. Items of weight 0 are never picked. The sample
+  # comes out in order of decreasing key.
+  rng = rng or random
+  keyed = ( (log(_positive(rng)) / w, x)
+            for (x, w) in izip(items, weights) if w > 0 )
+  return [ x for (_, x) in nlargest(k, keyed, key=lambda kx: kx[0]) ]
+#----------------------------------------------------------------------------}}}
+
+_END = object()
+
+def _positive(rng): # {{{
+  # a uniform number in (0, 1), safe to take the log of
+  u = rng.random()
+  while u == 0:
+    u = rng.random()
+  return u
+#----------------------------------------------------------------------------}}}
@@ -0,0 +1,90 @@
+# imports {{{1
+from __future__ import division
+from array import array
+
+from algorithms.graph import CSRGraph
+#---------------------------------------------------------------------------}}}1
+
+def strongly_connected_components(G): # {{{
+  # The strongly connected components of the directed graph G (an AdjList or
+  # a CSRGraph). Returns (count, labels), where labels is an array('i') with
+  # the component of every node, numbered 0..count-1 in a topological order
+  # of the condensation: every edge u -> v has labels[u] <= labels[v].
+  return tarjan(len(G), G.__getitem__)
+#----------------------------------------------------------------------------}}}
+def tarjan(n, neighbors): # {{{
+  # Tarjan's algorithm on the graph with nodes range(n) and successors
+  # neighbors(u), returning (count, labels) as for
+  # strongly_connected_components. It takes O(V+E) time and keeps an explicit
+  # stack, so it works on graphs far deeper than the recursion limit.
+  #
+  # index[u] is the DFS discovery order of u and low[u] the smallest index
+  # reachable from u's subtree through one non-tree edge into a component
+  # that isn't finished yet. u is the root of a component when low[u] ==
+  # index[u], and the component is everything above u on scc_stack. The
+  # components come out sinks first, so the labels are flipped at the end.
+  index = array('i', [-1]) * n
+  low = array('i', [0]) * n
+  labels = array('i', [-1]) * n
+  scc_stack = []
+  count = 0
+  order = 0
+  for root in range(n):
+    if index[root] != -1:
+      continue
+    index[root] = low[root] = order
+    order += 1
+    scc_stack.append(root)
+    nodes = [root]
+    iterators = [iter(neighbors(root))]
+    while nodes:
+      u = nodes[-1]
+      for v in iterators[-1]:
+        if index[v] == -1:
+          index[v] = low[v] = order
+          order += 1
+          scc_stack.append(v)
+          nodes.append(v)
+          iterators.append(iter(neighbors(v)))
+          break
+        # v is on scc_stack exactly when it has no label yet
+        if labels[v] == -1 and index[v] < low[u]:
+          low[u] = index[v]
+      else:
+        nodes.pop()
+        iterators.pop()
+        if nodes and low[u] < low[nodes[-1]]:
+          low[nodes[-1]] = low[u]
+        if low[u] == index[u]:
+          while True:
+            v = scc_stack.pop()
+            labels[v] = count
+            if v == u:
+              break
+          count += 1
+
+  for v in range(n):
+    labels[v] = count - 1 - labels[v]
+  return count, labels
+#----------------------------------------------------------------------------}}}
+
+def components(count, labels): # {{{
+  # The list of components, each a sorted list of its nodes, from the output
+  # of strongly_connected_components.
+  ret = [ [] for _ in range(count) ]
+  for (v, c) in enumerate(labels):
+    ret[c].append(v)
+  return ret
+#----------------------------------------------------------------------------}}}
+def condensation(G, count = None, labels = None): # {{{
+  # The condensation of the directed graph G: the DAG with one node per
+  # strongly connected component and an edge c -> d whenever some edge of G
+  # goes from component c to component d != c. Returns (C, labels), with C a
+  # directed CSRGraph whose nodes 0..count-1 are already in topological
+  # order, so C can be handed to the DAG algorithms.
+  if labels is None:
+    count, labels = strongly_connected_components(G)
+  edges = [ (labels[u], labels[v]) for u in G.nodes for v in G[u]
+            if labels[u] != labels[v] ]
+  return CSRGraph(count, edges, directed=True), labels
+#----------------------------------------------------------------------------}}}
@@ -0,0 +1,148 @@
+# imports {{{1
+from __future__ import division
+from array import array
+
+from algorithms.graph import weighted_graph
+from algorithms.heap import priority_dict
+#---------------------------------------------------------------------------}}}1
+
+def dijkstra(G, w, s, target = None): # {{{
+  # Single source shortest paths from s in O((V+E) log V). G is an AdjList or
+  # CSRGraph and w a dictionary of non-negative edge weights keyed by (u,v); w
+  # may be None if G is a CSRGraph that already has weights.
+  #
+  # Returns (dist, pred). dist[v] is the length of a shortest path from s to v
+  # (inf if there is none) and pred is an array('i') with the predecessor of v
+  # on that path (-1 for s and unreachable nodes). If target is given, the
+  # search stops as soon as target's distance is final; the other entries may
+  # then be incomplete.
+  G = weighted_graph(G, w)
+  offsets, targets, weights = G.offsets, G.targets, G.weights
+  inf = float("inf")
+  dist = [ inf for _ in G.nodes ]
+  pred = array('i', [-1]) * len(G)
+
+  dist[s] = 0
+  H = priority_dict({s: 0})
+  update_key = H.update_key
+  while H:
+    u = H.pop()
+    if u == target:
+      break
+    du = dist[u]
+    for i in range(offsets[u], offsets[u+1]):
+      v = targets[i]
+      d = du + weights[i]
+      if d < dist[v]:
+        dist[v] = d
+        pred[v] = u
+        update_key(v, d)
+  return dist, pred
+#----------------------------------------------------------------------------}}}
+
+def path_to(pred, t): # {{{
+  # The path s -> ... -> t read from a predecessor array, where s is the root
+  # (the node with no predecessor) reached from t.
+  path = [t]
+  while pred[path[-1]] != -1:
+    path.append(pred[path[-1]])
+  path.reverse()
+  return path
+#----------------------------------------------------------------------------}}}
+
+def shortest_path(G, w, s, t, heuristic = None): # {{{
+  # Point to point shortest path from s to t. Returns (path, cost), where path
+  # is the list of nodes from s to t, or (None, inf) if t can't be reached.
+  # G, w are as for dijkstra.
+  #
+  # By default this is a bidirectional Dijkstra: one search grows from s in G
+  # and one from t in the reverse graph, and they stop once the best path
+  # through a node seen by both can't be improved. Each search only has to
+  # reach about half way, so far fewer nodes are settled than with dijkstra.
+  #
+  # If heuristic is given, an A* search from s is used instead. heuristic(v)
+  # must never overestimate the distance from v to t (it must be admissible).
+  # The search touches only dictionaries of the nodes it reaches, so a query
+  # on a weighted CSRGraph with w = None costs nothing proportional to the
+  # size of G. Given w, G is first frozen with those weights, which is
+  # O(V+E); freeze it once (weighted_graph) and pass None for many queries.
+  G = weighted_graph(G, w)
+  if heuristic is not None:
+    return _astar(G, s, t, heuristic)
+  return _bidirectional_dijkstra(G, s, t)
+#----------------------------------------------------------------------------}}}
+
+def _join_paths(pred_s, pred_t, meet): # {{{
+  # Path from s to meet (following pred_s) and on from meet to t (following
+  # pred_t, the predecessors of the reverse search from t).
+  path = []
+  u = meet
+  while u != -1:
+    path.append(u)
+    u = pred_s[u]
+  path.reverse()
+  u = pred_t[meet]
+  while u != -1:
+    path.append(u)
+    u = pred_t[u]
+  return path
+#----------------------------------------------------------------------------}}}
+def _bidirectional_dijkstra(G, s, t): # {{{
+  inf = float("inf")
+  if s == t:
+    return [s], 0
+
+  # index 0 is the forward search from s, index 1 the reverse search from t
+  dist = [ {s: 0}, {t: 0} ]
+  pred = [ {s: -1}, {t: -1} ]
+  heaps = [ priority_dict({s: 0}), priority_dict({t: 0}) ]
+  rows = [ (G.offsets, G.targets, G.weights),
+           (G.rev_offsets, G.rev_targets, G.rev_weights) ]
+  best, meet = inf, None
+
+  while heaps[0] and heaps[1]:
+    # Any better path has a part of length at least the top key on each side.
+    if heaps[0][heaps[0].peek()] + heaps[1][heaps[1].peek()] >= best:
+      break
+
+    side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+    H, d_side, d_other, p_side = heaps[side], dist[side], dist[1-side], pred[side]
+    offsets, targets, weights = rows[side]
+    u = H.pop()
+    du = d_side[u]
+    for i in range(offsets[u], offsets[u+1]):
+      v = targets[i]
+      d = du + weights[i]
+      if d < d_side.get(v, inf):
+        d_side[v] = d
+        p_side[v] = u
+        H.update_key(v, d)
+        if v in d_other and d + d_other[v] < best:
+          best, meet = d + d_other[v], v
+
+  if meet is None:
+    return None, inf
+  return _join_paths(pred[0], pred[1], meet), best
+#----------------------------------------------------------------------------}}}
+def _astar(G, s, t, heuristic): # {{{
+  inf = float("inf")
+  offsets, targets, weights = G.offsets, G.targets, G.weights
+  dist = {s: 0}
+  pred = {s: -1}
+  H = priority_dict({s: heuristic(s)})
+  while H:
+    u = H.pop()
+    if u == t:
+      return _join_paths(pred, {t: -1}, t), dist[t]
+    du = dist[u]
+    for i in range(offsets[u], offsets[u+1]):
+      v = targets[i]
+      d = du + weights[i]
+      if d < dist.get(v, inf):
+        # if v was already settled this reopens it, which keeps the search
+        # correct for admissible heuristics that are not consistent
+        dist[v] = d
+        pred[v] = u
+        H.update_key(v, d + heuristic(v))
+  return None, inf
+#----------------------------------------------------------------------------}}}
@@ -0,0 +1,126 @@
+# imports {{{1
+from __future__ import division
+from fractions import Fraction
+try:
+  from math import gcd
+except ImportError:   # python 2
+  from fractions import gcd
+
+try:
+  import numpy as np
+except ImportError:   # only poly_sums needs numpy
+  np = None
+#---------------------------------------------------------------------------}}}1
+
+# Closed forms for sums of polynomials over integer ranges. Faulhaber's
+# formula writes F_p(n) = 1^p + 2^p + ... + n^p as a polynomial of degree p+1
+# in n, with F_p(0) = 0 and F_p(n) - F_p(n-1) = n^p for every integer n
+# (negative ones too), so
+#
+#   sum of k^p for lo <= k <= hi  =  F_p(hi) - F_p(lo - 1).
+#
+# A polynomial a_0 + a_1 k + ... + a_d k^d is summed by first combining the
+# F_p into one polynomial, so a range sum is a single evaluation, O(d) for
+# any length of range.
+
+_bernoulli = [ Fraction(1) ]      # B_0, B_1, ... with B_1 = +1/2
+_faulhaber = []                   # _faulhaber[p] = coefficients of F_p
+
+def _bernoulli_number(j): # {{{
+  # B_j from the recurrence sum_{i<=j} C(j+1, i) B_i = j+1 (the convention
+  # with B_1 = +1/2 that Faulhaber's formula needs)
+  while len(_bernoulli) <= j:
+    m = len(_bernoulli)
+    total = Fraction(0)
+    binomial = 1              # C(m+1, i)
+    for (i, b) in enumerate(_bernoulli):
+      total += binomial * b
+      binomial = binomial * (m + 1 - i) // (i + 1)
+    _bernoulli.append( (m + 1 - total) / (m + 1) )
+  return _bernoulli[j]
+#----------------------------------------------------------------------------}}}
+def faulhaber(p): # {{{
+  # The coefficients [c_0, c_1, ..., c_{p+1}] (Fractions) of
+  # F_p(n) = sum_j c_j n^j, cached.
+  while len(_faulhaber) <= p:
+    q = len(_faulhaber)
+    # F_q(n) = 1/(q+1) sum_{j=0}^{q} C(q+1, j) B_j n^{q+1-j}
+    coefficients = [ Fraction(0) ] * (q + 2)
+    binomial = 1
+    for j in range(q + 1):
+      coefficients[q + 1 - j] = binomial * _bernoulli_number(j) / (q + 1)
+      binomial = binomial * (q + 1 - j) // (j + 1)
+    _faulhaber.append(coefficients)
+  return _faulhaber[p]
+#----------------------------------------------------------------------------}}}
+
+def _antidifference(poly): # {{{
+  # The coefficients of Q = sum_p poly[p] F_p, so that the sum of poly(k) for
+  # lo <= k <= hi is Q(hi) - Q(lo - 1). Float coefficients are taken at
+  # their exact binary value.
+  Q = [ Fraction(0) ] * (len(poly) + 1)
+  for (p, a) in enumerate(poly):
+    if a:
+      a = Fraction(a)
+      for (j, c) in enumerate(faulhaber(p)):
+        Q[j] += a * c
+  return Q
+#----------------------------------------------------------------------------}}}
+def _evaluate(Q, n): # {{{
+  ret = Fraction(0)
+  for c in reversed(Q):
+    ret = ret * n + c
+  return ret
+#----------------------------------------------------------------------------}}}
+
+def power_sum(p, lo, hi): # {{{
+  # lo^p + (lo+1)^p + ... + hi^p, exactly, for integers lo, hi (0 if hi < lo).
+  return poly_sum([0] * p + [1], lo, hi)
+#----------------------------------------------------------------------------}}}
+def poly_sum(poly, lo, hi): # {{{
+  # The sum of poly(k) for lo <= k <= hi, where poly is the list of
+  # coefficients [a_0, a_1, ..., a_d] of a_0 + a_1 k + ... + a_d k^d. The
+  # result is exact: an int when it is an integer (always, for integer
+  # coefficients, however large), and a Fraction otherwise.
+  if hi < lo:
+    return 0
+  Q = _antidifference(poly)
+  ret = _evaluate(Q, hi) - _evaluate(Q, lo - 1)
+  return int(ret) if ret.denominator == 1 else ret
+#----------------------------------------------------------------------------}}}
+def poly_sums(polys, lo, hi): # {{{
+  # Batch version of poly_sum with numpy: lo and hi are arrays of m ranges,
+  # and polys is either one list of coefficients for all of them or an m by
+  # d+1 array with one polynomial per range. Returns a float64 array of the m
+  # sums (0 for empty ranges). All the queries are evaluated together, as one
+  # matrix product for the antidifferences and one vectorized Horner pass for
+  # each end of the ranges. Being floating point, the sums are exact only
+  # while the intermediate values stay below 2^53; use poly_sum for exact
+  # big integers.
+  if np is None:
+    raise ImportError("poly_sums needs numpy")
+  lo = np.asarray(lo, dtype=np.float64)
+  hi = np.asarray(hi, dtype=np.float64)
+  polys = np.asarray(polys, dtype=np.float64)
+  d = polys.shape[-1] - 1
+
+  # Row p of F holds the coefficients of F_p times the common denominator L
+  # of all of them, so F is an integer matrix and polys.dot(F) holds the
+  # antidifferences times L. Only the final division can round, and then not
+  # when the sum is an integer.
+  L = 1
+  for p in range(d + 1):
+    for c in faulhaber(p):
+      L = L * c.denominator // gcd(L, c.denominator)
+  F = np.zeros( (d + 1, d + 2) )
+  for p in range(d + 1):
+    F[p, :p + 2] = [ float(c * L) for c in faulhaber(p) ]
+  Q = polys.dot(F)
+
+  def evaluate(n):
+    ret = np.zeros(np.broadcast(n, Q[..., 0]).shape)
+    for j in range(d + 1, -1, -1):
+      ret = ret * n + Q[..., j]
+    return ret
+  return np.where(hi < lo, 0.0, (evaluate(hi) - evaluate(lo - 1)) / L)
+#----------------------------------------------------------------------------}}}
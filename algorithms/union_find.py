@@ -0,0 +1,93 @@
+# imports {{{1
+from __future__ import division
+from array import array
+#---------------------------------------------------------------------------}}}1
+
+class UnionFind: # {{{1
+  # A disjoint-set (union-find) structure on the elements range(n).
+  #
+  # UnionFind.parent is an array('i') of parent pointers; the root of each tree
+  # names its set. UnionFind.rank is an array('i') of upper bounds on the tree
+  # heights, used by union to hang the shorter tree under the taller one. find
+  # uses path halving (every node on the path is pointed at its grandparent),
+  # so the trees stay almost flat and both operations take nearly constant
+  # amortized time, without a second pass or recursion.
+  #
+  # UnionFind.count is the number of sets, kept up to date by union, so
+  # connectivity of a stream of edges can be tracked one edge at a time.
+
+  def __init__(self, n): # {{{
+    self.parent = array('i', range(n))
+    self.rank = array('i', [0]) * n
+    self.count = n
+  #--------------------------------------------------------------------------}}}
+
+  def find(self, x): # {{{
+    # Return the root of the set containing x.
+    parent = self.parent
+    while parent[x] != x:
+      parent[x] = parent[parent[x]]
+      x = parent[x]
+    return x
+  #--------------------------------------------------------------------------}}}
+  def union(self, x, y): # {{{
+    # Merge the sets containing x and y. Return False if they were already the
+    # same set, and True otherwise.
+    x, y = self.find(x), self.find(y)
+    if x == y:
+      return False
+    rank = self.rank
+    if rank[x] < rank[y]:
+      x, y = y, x
+    self.parent[y] = x
+    if rank[x] == rank[y]:
+      rank[x] += 1
+    self.count -= 1
+    return True
+  #--------------------------------------------------------------------------}}}
+  def union_many(self, pairs): # {{{
+    # union every pair (x,y) in pairs, and return how many merges happened
+    parent, rank = self.parent, self.rank
+    merged = 0
+    for (x, y) in pairs:
+      while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+      while parent[y] != y:
+        parent[y] = parent[parent[y]]
+        y = parent[y]
+      if x == y:
+        continue
+      if rank[x] < rank[y]:
+        x, y = y, x
+      parent[y] = x
+      if rank[x] == rank[y]:
+        rank[x] += 1
+      merged += 1
+    self.count -= merged
+    return merged
+  #--------------------------------------------------------------------------}}}
+  def connected(self, x, y): # {{{
+    return self.find(x) == self.find(y)
+  #--------------------------------------------------------------------------}}}
+  def components(self): # {{{
+    # Return an array('i') of component labels: label[x] == label[y] exactly
+    # when x and y are in the same set, and the labels are 0, ..., count-1 in
+    # order of each set's smallest element.
+    n = len(self.parent)
+    label = array('i', [-1]) * n
+    root_label = array('i', [-1]) * n
+    next_label = 0
+    for x in range(n):
+      root = self.find(x)
+      if root_label[root] == -1:
+        root_label[root] = next_label
+        next_label += 1
+      label[x] = root_label[root]
+    return label
+  #--------------------------------------------------------------------------}}}
+
+  def __len__(self):  # {{{
+    return len(self.parent)
+  #--------------------------------------------------------------------------}}}
+#----------------------------------------------------------------------------}}}1